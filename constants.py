@@ -36,6 +36,8 @@ MSG_THUMB_LOADED_FOR_HISTORY = "THUMB_LOADED_FOR_HISTORY"
 
 # --- UI Appearance ---
 THUMBNAIL_SIZE = (128, 72)
+# Resized copy of a history thumbnail, stored next to the source image
+THUMBNAIL_CACHE_SUFFIX = f".{THUMBNAIL_SIZE[0]}x{THUMBNAIL_SIZE[1]}.webp"
 
 # --- External Tools ---
 FFMPEG_TIMEOUT = 30 
@@ -9,6 +9,8 @@ import time
 import json
 import queue
 import uuid  # 1. ADDED MISSING IMPORT
+from functools import lru_cache
+from urllib.parse import urlsplit
 
 from constants import (
     MSG_LOG_PREFIX,
@@ -18,50 +20,39 @@ from constants import (
     MSG_DOWNLOAD_ITEM_ADDED,
 )
 from ui_elements.subprocess_output_processor import SubprocessOutputProcessor
+from utils import POPEN_PLATFORM_KWARGS
 
 
-def get_subprocess_startupinfo():
-    """Returns platform-specific startupinfo to prevent console window."""
-    if sys.platform.startswith("win"):
-        si = subprocess.STARTUPINFO()
-        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        si.wShowWindow = subprocess.SW_HIDE
-        return si
-    return None
-
-
-def detect_platform(url):
-    """Detects the platform based on the URL."""
-    if re.search(r"youtube\.com|youtu\.be", url, re.IGNORECASE):
+@lru_cache(maxsize=128)
+def _detect_platform_for_host(host):
+    if re.search(r"youtube\.com|youtu\.be", host, re.IGNORECASE):
         return "youtube"
     # Add other platform detections as needed
     return "other"
 
 
+def detect_platform(url):
+    """
+    Detects the platform based on the URL's host. Results are cached per host,
+    so every item of a playlist resolves with a single lookup.
+    """
+    return _detect_platform_for_host(urlsplit(url).netloc or url)
+
+
 # 2. ADDED MISSING HELPER FUNCTIONS (MOVED FROM OLD download_logic.py)
 def generate_thumbnail_from_video_logic(video_path, output_thumb_path, log_func):
     """Generates a thumbnail from a video file using ffmpeg."""
-    if not os.path.exists(video_path):
+    try:
+        stat_result = os.stat(video_path)
+    except OSError:
         log_func(f"Video file not found for thumbnail generation: {video_path}")
         return False
     try:
-        ffprobe_cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            video_path,
-        ]
-        duration_str = subprocess.check_output(
-            ffprobe_cmd,
-            timeout=FFMPEG_TIMEOUT,
-            startupinfo=get_subprocess_startupinfo(),
-            env=os.environ.copy(),
-        ).decode("utf-8")
-        duration = float(duration_str)
+        # Goes through the shared duration cache, so the history's duration
+        # job for this same file afterwards needs no ffprobe run of its own.
+        duration = _probe_media_duration(
+            video_path, stat_result.st_mtime_ns, stat_result.st_size
+        )
         mid_point = duration / 2
 
         ffmpeg_cmd = [
@@ -82,8 +73,7 @@ def generate_thumbnail_from_video_logic(video_path, output_thumb_path, log_func)
             check=True,
             capture_output=True,
             timeout=FFMPEG_TIMEOUT,
-            startupinfo=get_subprocess_startupinfo(),
-            env=os.environ.copy(),
+            **POPEN_PLATFORM_KWARGS,
         )
         log_func(
             f"Successfully generated thumbnail: {os.path.basename(output_thumb_path)}"
@@ -124,8 +114,7 @@ def extract_album_art_logic(audio_path, output_art_path, log_func):
             check=True,
             capture_output=True,
             timeout=FFMPEG_TIMEOUT,
-            startupinfo=get_subprocess_startupinfo(),
-            env=os.environ.copy(),
+            **POPEN_PLATFORM_KWARGS,
         )
         log_func(
             f"Successfully extracted album art: {os.path.basename(output_art_path)}"
@@ -138,29 +127,42 @@ def extract_album_art_logic(audio_path, output_art_path, log_func):
         return False
 
 
+@lru_cache(maxsize=1024)
+def _probe_media_duration(file_path, mtime_ns, file_size):
+    """
+    Runs ffprobe for one file. ffprobe accepts a single input per run, so
+    results are cached on (path, mtime, size) instead: rescanning unchanged
+    files spawns no processes. Failures raise and are therefore not cached.
+    """
+    ffprobe_cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        file_path,
+    ]
+    duration_str = subprocess.check_output(
+        ffprobe_cmd,
+        timeout=FFMPEG_TIMEOUT,
+        **POPEN_PLATFORM_KWARGS,
+    ).decode("utf-8")
+    return float(duration_str)
+
+
 def get_media_duration_logic(file_path, log_func):
     """Gets the duration of a media file using ffprobe."""
-    if not os.path.exists(file_path):
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
         log_func(f"File not found for duration probe: {file_path}")
         return None
     try:
-        ffprobe_cmd = [
-            "ffprobe",
-            "-v",
-            "error",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",
-            file_path,
-        ]
-        duration_str = subprocess.check_output(
-            ffprobe_cmd,
-            timeout=FFMPEG_TIMEOUT,
-            startupinfo=get_subprocess_startupinfo(),
-            env=os.environ.copy(),
-        ).decode("utf-8")
-        return float(duration_str)
+        return _probe_media_duration(
+            file_path, stat_result.st_mtime_ns, stat_result.st_size
+        )
     except Exception as e:
         log_func(f"Error getting duration for {os.path.basename(file_path)}: {e}")
         return None
@@ -192,6 +194,13 @@ def _get_yt_dlp_command_base():
         return [sys.executable, "-m", "yt_dlp"]
 
 
+# Resolved once at import; the install layout doesn't change while the app runs.
+YT_DLP_COMMAND_BASE = _get_yt_dlp_command_base()
+
+# Platforms whose titles are often blank or generic, so file names get the uploader
+UPLOADER_PREFIXED_PLATFORMS = frozenset(("instagram", "tiktok"))
+
+
 def run_download_process(
     url,
     platform,
@@ -205,12 +214,15 @@ def run_download_process(
     embed_subtitles=True,
     cancel_event: threading.Event = None,
     is_playlist_item: bool = False,
+    download_id=None,
 ):
     """
-    Constructs the yt-dlp command and starts a SubprocessOutputProcessor
-    to manage the download process.
+    Constructs the yt-dlp command and runs a SubprocessOutputProcessor to
+    manage the download process. Blocks until the download has finished, so
+    the calling (pool) thread stays busy for as long as yt-dlp runs.
     """
-    download_id = str(uuid.uuid4())
+    if download_id is None:
+        download_id = str(uuid.uuid4())
 
     try:
         output_queue.put(
@@ -221,7 +233,7 @@ def run_download_process(
                     "url": url,
                     "title": url,
                     "type": download_type,
-                    "platform": detect_platform(url),
+                    "platform": platform,
                     "is_playlist_item": is_playlist_item,
                     "status": "starting",
                 },
@@ -231,7 +243,7 @@ def run_download_process(
     except queue.Full:
         pass
 
-    command_base = _get_yt_dlp_command_base()
+    command_base = YT_DLP_COMMAND_BASE
     if command_base is None:
         error_msg = "CRITICAL BUILD ERROR: yt-dlp executable not found in the application bundle."
         output_queue.put(
@@ -253,7 +265,7 @@ def run_download_process(
         "--print-json",
     ]
 
-    if platform in ["instagram", "tiktok"]:
+    if platform in UPLOADER_PREFIXED_PLATFORMS:
         output_template_base = "%(uploader)s - %(title)s.%(ext)s"
 
     if selected_format_code and selected_format_code.lower() != "best":
@@ -317,4 +329,6 @@ def run_download_process(
         subtitle_options=subtitle_options_tuple,
         cancel_event=cancel_event,
     )
-    processor.start()
\ No newline at end of file
+    # Run on the calling thread rather than a thread of its own: the download
+    # pool's size then really caps how many yt-dlp processes run at once.
+    processor.run()
\ No newline at end of file
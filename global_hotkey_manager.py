@@ -19,7 +19,7 @@ class GlobalHotkeyManager:
 
     def _on_activate(self):
         """Called when the hotkey is pressed."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self._last_trigger_time > self._debounce_delay:
             self.log_func(f"Global hotkey '{self.hotkey_combination_str}' pressed. Triggering callback.")
             self._last_trigger_time = current_time
@@ -1,4 +1,5 @@
 import json
+import mmap
 import os
 from constants import (
     SETTINGS_FILE, DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE_NAME,
@@ -6,6 +7,9 @@ from constants import (
 )
 import time
 
+# Below roughly a page, a plain read() is cheaper than setting up a mapping.
+SETTINGS_MMAP_THRESHOLD = 4096
+
 def get_default_settings():
     """Returns a dictionary of default application settings."""
     return {
@@ -23,18 +27,30 @@ def get_default_settings():
         "auto_paste_on_focus": True,
         "global_hotkey_enabled": False,
         "global_hotkey_combination": "<ctrl>+<shift>+D",
+        # Wall-clock time.time() value: it is compared across app restarts, so it
+        # can't use time.monotonic() like the in-process debounce timers do.
         "last_deps_check_timestamp": 0.0,
         "app_version_at_last_deps_check": "0.0.0",
         "history_item_size_name": DEFAULT_HISTORY_ITEM_SIZE_NAME,
-        "show_download_complete_popup": True
+        "show_download_complete_popup": True,
+        "max_parallel_downloads": 3,
+        "thumbnail_workers": 4
     }
 
 def load_settings():
     """Loads settings from the settings file, using defaults if not found or invalid."""
     try:
         if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, 'r') as f:
-                loaded_settings = json.load(f)
+            with open(SETTINGS_FILE, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return get_default_settings()
+                if size < SETTINGS_MMAP_THRESHOLD:
+                    raw_settings = f.read()
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        raw_settings = mm[:]
+                loaded_settings = json.loads(raw_settings)
                 defaults = get_default_settings()
                 
                 # Update loaded settings with any new default keys
@@ -54,7 +70,7 @@ def load_settings():
 
                 return loaded_settings
         return get_default_settings()
-    except (json.JSONDecodeError, IOError) as e:
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
         print(f"Error loading settings from {SETTINGS_FILE}: {e}. Using defaults.")
         return get_default_settings()
 
@@ -3,21 +3,34 @@ import subprocess
 import sys
 import os
 import re
-import pyperclip
 import threading
 import time
-import json
 import uuid
 import queue
-import shlex
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache
 import customtkinter as ctk
 from PIL import Image
 
+try:
+    # Optional: libvips shrink-on-load decodes only what the thumbnail needs.
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
+try:
+    # Optional: SIMD Lanczos resampling for the Pillow decode path.
+    from pic_scale import Plan as PicScalePlan, Resampling as PicScaleResampling
+except ImportError:
+    PicScalePlan = None
+
 from constants import (
     MSG_LOG_PREFIX,
     MSG_DOWNLOAD_ITEM_ADDED,
     MSG_THUMB_LOADED_FOR_HISTORY,
     THUMBNAIL_SIZE,
+    THUMBNAIL_CACHE_SUFFIX,
 )
 
 # 3. CORRECTED IMPORT PATH
@@ -26,26 +39,217 @@ from download_process_core import (
     generate_thumbnail_from_video_logic,
     extract_album_art_logic,
     get_media_duration_logic,
-    get_subprocess_startupinfo,
     run_download_process,
+    YT_DLP_COMMAND_BASE,
 )
 from global_hotkey_manager import GlobalHotkeyManager
+from utils import get_clipboard_sequence_number, POPEN_PLATFORM_KWARGS
 from ui_elements.subprocess_output_processor import SubprocessOutputProcessor
 
 
 MSG_DURATION_DONE = "DURATION_DONE"
+# Posted when a download's pool worker returns: (msg, download_id, error or None)
+MSG_DOWNLOAD_WORKER_DONE = "DOWNLOAD_WORKER_DONE"
+CLIPBOARD_URL_PATTERN = re.compile(r"https?://\S+")
+# How long a clipboard read is reused when the OS offers no change counter
+CLIPBOARD_REUSE_SECONDS = 0.5
+
 QUEUE_PUT_TIMEOUT = 0.05
 
+# Pre-built log prefixes for the worker threads' queue messages
+LOG_WARN_PREFIX = f"{MSG_LOG_PREFIX} WARN: "
+LOG_ERROR_PREFIX = f"{MSG_LOG_PREFIX} ERROR: "
+LOG_FFPROBE_PREFIX = f"{MSG_LOG_PREFIX} (ffprobe) "
+
+# Thumbnail decodes are independent; a few workers overlap disk I/O and decoding.
+# Default for the "thumbnail_workers" setting.
+THUMBNAIL_LOADER_WORKERS = 4
+# Pillow first box-reduces to at least this multiple of the thumbnail size,
+# then resamples the rest with Lanczos
+THUMBNAIL_REDUCING_GAP = 2.0
+# Default for the "max_parallel_downloads" setting
+MAX_PARALLEL_DOWNLOADS = 3
+# ffprobe runs are dominated by process startup, so they overlap well too
+DURATION_PROBE_WORKERS = min(8, os.cpu_count() or 2)
+
+# Playlist fetch: pipe read size and the minimum seconds between "Fetched N items"
+# label updates (~10 Hz)
+PLAYLIST_READ_CHUNK_SIZE = 64 * 1024
+PLAYLIST_PROGRESS_INTERVAL = 0.1
+
+def _worker_count_setting(settings, key, default):
+    """
+    Reads a worker count from the (user-editable) settings. Anything that isn't
+    a number falls back to default; numbers are clamped to at least 1.
+    """
+    try:
+        return max(1, int(settings.get(key, default)))
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def _save_thumbnail_cache(pil_img, cache_path):
+    try:
+        pil_img.save(cache_path, "WEBP", quality=85)
+    except Exception:
+        # Caching is best effort (read-only folder, Pillow without WebP, ...)
+        pass
+
+
+def _load_thumbnail_image(thumb_path):
+    """
+    Returns a PIL image of thumb_path no larger than THUMBNAIL_SIZE, using the
+    resized on-disk copy when it is at least as new as the source image.
+    """
+    cache_path = thumb_path + THUMBNAIL_CACHE_SUFFIX
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(thumb_path):
+            cached_img = Image.open(cache_path)
+            cached_img.load()
+            return cached_img
+    except Exception:
+        pass  # Missing or unreadable cache file; decode the source instead
+
+    pil_img = _decode_thumbnail_image(thumb_path)
+    # Written on this (pool) thread: a thread per save would make the number of
+    # threads grow with the number of new thumbnails
+    _save_thumbnail_cache(pil_img, cache_path)
+    return pil_img
+
+
+def _decode_thumbnail_image(thumb_path):
+    """Decodes an image file into a PIL image no larger than THUMBNAIL_SIZE."""
+    if pyvips is not None:
+        try:
+            vimg = pyvips.Image.thumbnail(
+                thumb_path, THUMBNAIL_SIZE[0], height=THUMBNAIL_SIZE[1], size="down"
+            )
+            if vimg.hasalpha():
+                vimg = vimg.flatten()
+            vimg = vimg.colourspace("srgb").cast("uchar")
+            return Image.frombuffer(
+                "RGB",
+                (vimg.width, vimg.height),
+                vimg.write_to_memory(),
+                "raw",
+                "RGB",
+                0,
+                1,
+            )
+        except pyvips.Error:
+            pass  # Fall back to Pillow below
+    # Shrink inside the with-block and keep only a copy of the small result, so
+    # the file handle is closed and the full-size decode buffer freed right away.
+    with Image.open(thumb_path) as src:
+        if src.format == "JPEG":
+            # libjpeg scales by 1/2..1/8 while decoding; keep 2x for Lanczos
+            src.draft("RGB", (THUMBNAIL_SIZE[0] * 2, THUMBNAIL_SIZE[1] * 2))
+        if PicScalePlan is not None:
+            resized = _pic_scale_thumbnail(src)
+            if resized is not None:
+                return resized
+        src.thumbnail(
+            THUMBNAIL_SIZE, Image.Resampling.LANCZOS, reducing_gap=THUMBNAIL_REDUCING_GAP
+        )
+        pil_img = src.copy()
+    return pil_img
+
+
+# Image modes pic-scale resamples directly; other images are converted to RGB
+PIC_SCALE_MODES = ("L", "LA", "RGB", "RGBA")
+
+
+@lru_cache(maxsize=32)
+def _pic_scale_plan(src_size, dst_size, mode):
+    """Resize plan (precomputed filter weights) for one size pair and image mode."""
+    return PicScalePlan(src_size, dst_size, PicScaleResampling.LANCZOS, mode)
+
+
+def _pic_scale_thumbnail(src):
+    """
+    Resizes src to fit THUMBNAIL_SIZE (keeping its aspect ratio) with pic-scale.
+    Returns None if the image is already small enough or pic-scale rejects it,
+    so Pillow is used instead.
+    """
+    width, height = src.size
+    scale = min(THUMBNAIL_SIZE[0] / width, THUMBNAIL_SIZE[1] / height)
+    if scale >= 1:
+        return None  # Already small enough; Pillow's thumbnail() leaves it as is
+    dst_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    img = src if src.mode in PIC_SCALE_MODES else src.convert("RGB")
+    try:
+        return _pic_scale_plan(img.size, dst_size, img.mode).resize(img)
+    except ValueError:
+        return None  # Input pic-scale doesn't support (it reports those as ValueError)
+
+
+@lru_cache(maxsize=512)
+def _cached_ctk_image(thumb_path, mtime_ns):
+    """
+    Builds the CTkImage for a thumbnail file. Keyed on the file's mtime so a
+    history refresh reuses the decoded image unless the file was rewritten.
+    """
+    pil_img = _load_thumbnail_image(thumb_path)
+    return ctk.CTkImage(
+        light_image=pil_img,
+        dark_image=pil_img,
+        size=THUMBNAIL_SIZE,
+    )
+
+
+def _build_history_thumbnail(job):
+    """Loads one history thumbnail job and returns the queue message to post."""
+    thumb_path = job["thumb_path"]
+    thumb_mtime_ns = job["thumb_mtime_ns"]
+    try:
+        ctk_image = _cached_ctk_image(thumb_path, thumb_mtime_ns)
+        return (
+            MSG_THUMB_LOADED_FOR_HISTORY,
+            (thumb_path, thumb_mtime_ns),
+            ctk_image,
+            job["item_id"],
+        )
+    except Exception as e:
+        return (
+            LOG_WARN_PREFIX
+            + f"Failed to load history thumbnail {os.path.basename(thumb_path)}: {e}"
+        )
+
+
 # ... (The rest of the AppLogic class remains exactly the same as before) ...
 class AppLogic:
     def __init__(self, app_instance, download_threads_list):
         self.app = app_instance
         self.global_hotkey_manager = None
-        self._last_focus_paste_time = 0
-
-        self.thumbnail_gen_threads = []
-        self.duration_gen_threads = []
+        self._last_focus_paste_time = 0.0
+        self._last_clipboard_seq = None
+        self._last_clipboard_content = None
+        self._last_clipboard_url = None
+        self._last_clipboard_read_time = float("-inf")
+        self._last_detected_url = None
+        self._last_detected_platform = None
+        self._playlist_fetch_count = 0
+        self._playlist_progress_update_pending = False
+
+        # Set while a history thumbnail / duration batch is running
+        self._history_thumb_busy = threading.Event()
+        self._duration_busy = threading.Event()
         self.app_threads_list = download_threads_list
+        # Upper bound on simultaneous downloads (yt-dlp processes)
+        self.max_parallel_downloads = _worker_count_setting(
+            self.app.settings, "max_parallel_downloads", MAX_PARALLEL_DOWNLOADS
+        )
+        self._download_executor = None  # Created on the first download
+        self._thumbnail_executor = ThreadPoolExecutor(
+            max_workers=_worker_count_setting(
+                self.app.settings, "thumbnail_workers", THUMBNAIL_LOADER_WORKERS
+            ),
+            thread_name_prefix="history_thumbnail_worker",
+        )
+        self._duration_executor = ThreadPoolExecutor(
+            max_workers=DURATION_PROBE_WORKERS,
+            thread_name_prefix="duration_probe_worker",
+        )
 
         self.current_playlist_download_info = {
             "total_items": 0,
@@ -54,116 +258,176 @@ class AppLogic:
             "skipped_items": 0,
             "cancelled": False,
         }
+        self.refresh_player_command()
 
     def _process_thumbnail_loading_tasks(self, loading_jobs):
-        """Processes thumbnail loading jobs for the history display."""
-        for job in loading_jobs:
-            thumb_path, original_item_index = (
-                job["thumb_path"],
-                job["original_index"],
-            )
-            try:
-                pil_img = Image.open(thumb_path)
-                pil_img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                ctk_image = ctk.CTkImage(
-                    light_image=pil_img,
-                    dark_image=pil_img,
-                    size=THUMBNAIL_SIZE,
-                )
-                self.app.thumbnail_gen_queue.put(
-                    (
-                        MSG_THUMB_LOADED_FOR_HISTORY,
-                        thumb_path,
-                        ctk_image,
-                        original_item_index,
-                    ),
-                    timeout=QUEUE_PUT_TIMEOUT,
-                )
-            except Exception as e:
-                self.app.thumbnail_gen_queue.put(
-                    f"{MSG_LOG_PREFIX} WARN: Failed to load history thumbnail {os.path.basename(thumb_path)}: {e}",
-                    timeout=QUEUE_PUT_TIMEOUT,
+        """
+        Loads history thumbnails on the thumbnail pool and posts each result
+        to the UI queue as it finishes.
+        """
+        futures = [
+            self._thumbnail_executor.submit(_build_history_thumbnail, job)
+            for job in loading_jobs
+        ]
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue  # Dropped by shutdown_workers() on exit
+            message = future.result()
+            if isinstance(message, str):
+                # Warnings are best effort; only loaded images must be delivered
+                try:
+                    self.app.ui_queue.put_nowait(message)
+                except queue.Full:
+                    pass
+            else:
+                self.app.ui_queue.put(
+                    message, timeout=QUEUE_PUT_TIMEOUT
                 )
 
+    def clear_thumbnail_image_cache(self):
+        """Drops the decoded history thumbnails kept between refreshes."""
+        _cached_ctk_image.cache_clear()
+
     def start_thumbnail_loading_for_history(self, loading_jobs):
         """Starts a thread to load thumbnails for existing history items."""
-        self.thumbnail_gen_threads = [
-            t for t in self.thumbnail_gen_threads if t.is_alive()
-        ]
-        if not any(
-            t.is_alive() and t.name == "history_thumbnail_loader"
-            for t in self.thumbnail_gen_threads
-        ):
-            thread = threading.Thread(
-                target=self._process_thumbnail_loading_tasks,
-                args=(loading_jobs,),
-                daemon=True,
-                name="history_thumbnail_loader",
-            )
-            thread.start()
-            self.thumbnail_gen_threads.append(thread)
+        self._start_guarded_worker(
+            self._history_thumb_busy,
+            self._process_thumbnail_loading_tasks,
+            loading_jobs,
+            "history_thumbnail_loader",
+        )
 
     def _process_duration_tasks(self, files_for_duration_jobs):
         """Processes media duration calculation jobs."""
 
         def log_adapter(msg):
+            # Best effort: never stall a probe worker on UI backpressure for a log line
             try:
-                self.app.duration_queue.put(
-                    f"{MSG_LOG_PREFIX} (ffprobe) {msg}",
-                    timeout=QUEUE_PUT_TIMEOUT,
-                )
+                self.app.ui_queue.put_nowait(LOG_FFPROBE_PREFIX + msg)
             except queue.Full:
                 pass
 
-        for job in files_for_duration_jobs:
-            file_path, original_index = job["file_path"], job["original_index"]
+        def probe_job(job):
+            file_path, item_id = job["file_path"], job["item_id"]
             duration_seconds = get_media_duration_logic(file_path, log_adapter)
-            self.app.duration_queue.put(
-                (MSG_DURATION_DONE, file_path, duration_seconds, original_index),
+            self.app.ui_queue.put(
+                (MSG_DURATION_DONE, file_path, duration_seconds, item_id),
                 timeout=QUEUE_PUT_TIMEOUT,
             )
 
+        # Each ffprobe is an independent subprocess; run them side by side and
+        # keep this thread alive until the whole batch is done.
+        wait(
+            [
+                self._duration_executor.submit(probe_job, job)
+                for job in files_for_duration_jobs
+            ]
+        )
+
     def start_duration_calculation_for_files(self, files_for_duration_jobs):
         """Starts a thread to calculate media durations."""
-        self.duration_gen_threads = [
-            t for t in self.duration_gen_threads if t.is_alive()
-        ]
-        if not any(t.is_alive() for t in self.duration_gen_threads):
-            thread = threading.Thread(
-                target=self._process_duration_tasks,
-                args=(files_for_duration_jobs,),
-                daemon=True,
+        self._start_guarded_worker(
+            self._duration_busy,
+            self._process_duration_tasks,
+            files_for_duration_jobs,
+            "duration_calculator",
+        )
+
+    @staticmethod
+    def _start_guarded_worker(busy_event, task, jobs, name):
+        """
+        Runs task(jobs) on a daemon thread unless busy_event shows a previous
+        batch is still running. The event is set here, before the thread
+        starts, so two quick calls can't both start a worker.
+        """
+        if busy_event.is_set():
+            return
+        busy_event.set()
+
+        def run():
+            try:
+                task(jobs)
+            finally:
+                busy_event.clear()
+
+        threading.Thread(target=run, daemon=True, name=name).start()
+
+    def active_background_workers(self):
+        """Returns the names of the history thumbnail/duration batches still running."""
+        return [
+            name
+            for name, busy in (
+                ("history thumbnails", self._history_thumb_busy),
+                ("durations", self._duration_busy),
             )
-            thread.start()
-            self.duration_gen_threads.append(thread)
+            if busy.is_set()
+        ]
 
     def _format_duration(self, seconds):
         if seconds is None or seconds < 0:
             return "Duration: N/A"
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        seconds = int(seconds % 60)
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         if hours > 0:
             return f"Duration: {hours}:{minutes:02d}:{seconds:02d}"
         return f"Duration: {minutes:02d}:{seconds:02d}"
 
+    def _player_error(self, title, message):
+        """Logs a player/open failure and reports it to the user."""
+        self.app.log_message(f"ERROR: {message}")
+        self.app.messagebox.showerror(title, message, parent=self.app)
+
+    def refresh_player_command(self):
+        """
+        Splits the player command setting into argv tokens once; call again
+        whenever the setting changes. Tokens containing {file} get the media
+        path substituted at open time, otherwise the path is appended.
+        """
+        player_command = self.app.settings.get("player_command", "").strip()
+        self._player_tokens = None
+        self._player_command_error = None
+        if not player_command:
+            return
+        import shlex  # Only needed when a custom player is configured
+
+        try:
+            tokens = shlex.split(player_command)
+        except ValueError as e:
+            self._player_command_error = e
+            return
+        self._player_tokens = tokens
+        self._player_has_placeholder = any("{file}" in token for token in tokens)
+
     def open_file_with_player(self, file_path):
-        player_command = self.app.settings.get("player_command", "")
+        """Opens file_path with the configured player; returns whether it was launched."""
         normalized_path = os.path.normpath(file_path)
-        if not os.path.exists(normalized_path):
-            self.app.messagebox.showerror(
-                "File Not Found",
-                f"The media file could not be found:\n{normalized_path}",
-                parent=self.app,
+        if self._player_command_error is not None:
+            self._player_error(
+                "Open Error",
+                f"Invalid player command: {self._player_command_error}",
             )
-            return
+            return False
+
+        # os.startfile reports a missing file itself (FileNotFoundError below);
+        # a player or xdg-open/open is launched fine and fails later, unseen.
+        if not sys.platform.startswith("win") or self._player_tokens:
+            if not os.path.exists(normalized_path):
+                self._player_error(
+                    "File Not Found",
+                    f"The media file could not be found:\n{normalized_path}",
+                )
+                return False
 
         try:
-            if player_command and player_command.strip():
-                command_parts = shlex.split(
-                    player_command.replace("{file}", shlex.quote(normalized_path))
-                )
-                subprocess.Popen(command_parts, env=os.environ.copy())
+            if self._player_tokens:
+                if self._player_has_placeholder:
+                    command_parts = [
+                        token.replace("{file}", normalized_path)
+                        for token in self._player_tokens
+                    ]
+                else:
+                    command_parts = self._player_tokens + [normalized_path]
+                subprocess.Popen(command_parts)
             else:
                 if sys.platform.startswith("win"):
                     os.startfile(normalized_path)
@@ -171,33 +435,74 @@ class AppLogic:
                     subprocess.Popen(["open", normalized_path])
                 else:
                     subprocess.Popen(["xdg-open", normalized_path])
+            return True
+        except FileNotFoundError as e:
+            # Either the media file (os.startfile) or the player executable.
+            if e.filename == normalized_path:
+                self._player_error(
+                    "File Not Found",
+                    f"The media file could not be found:\n{normalized_path}",
+                )
+            else:
+                self._player_error(
+                    "Open Error",
+                    f"The player could not be found: {e.filename or e}",
+                )
         except Exception as e:
-            self.app.messagebox.showerror(
-                "Open Error", f"Failed to open media: {e}", parent=self.app
-            )
+            self._player_error("Open Error", f"Failed to open media: {e}")
+        return False
 
     def get_and_validate_clipboard_url(self):
         """Retrieves and validates a URL from the clipboard."""
         try:
-            content = pyperclip.paste()
-            match = re.search(r"https?://\S+", content)
-            if match:
-                url = match.group(0)
-                self.app.url_var.set(url)
-                platform = detect_platform(url)
-                self.app.platform_label_var.set(f"Platform: {platform.capitalize()}")
-                return url
+            clipboard_seq = get_clipboard_sequence_number()
+            now = time.monotonic()
+            # When the OS reports the clipboard unchanged, skip reading it; when the
+            # text read back is unchanged, skip the URL scan. Either way the last
+            # result is reused. Without an OS change counter (e.g. Linux, where
+            # paste() spawns xclip/xsel), a read from the last moment is reused.
+            if clipboard_seq is None:
+                clipboard_changed = (
+                    now - self._last_clipboard_read_time >= CLIPBOARD_REUSE_SECONDS
+                )
+            else:
+                clipboard_changed = clipboard_seq != self._last_clipboard_seq
+            if clipboard_changed:
+                import pyperclip  # Deferred until the clipboard is first read
+
+                content = pyperclip.paste()
+                self._last_clipboard_read_time = now
+                if content != self._last_clipboard_content:
+                    match = CLIPBOARD_URL_PATTERN.search(content)
+                    self._last_clipboard_content = content
+                    self._last_clipboard_url = match.group(0) if match else None
+                self._last_clipboard_seq = clipboard_seq
+
+            url = self._last_clipboard_url
+            if url and self.app.url_var.get() != url:
+                self._show_clipboard_url(url)
+            return url
         except Exception:
             return None
-        return None
+
+    def _show_clipboard_url(self, url):
+        self.app.url_var.set(url)
+        platform = detect_platform(url)
+        self._last_detected_url = url
+        self._last_detected_platform = platform
+        self.app.platform_label_var.set(f"Platform: {platform.capitalize()}")
 
     def on_main_window_focus(self, event):
+        # <FocusIn> fires for every child widget, so do the cheap monotonic
+        # throttle check before touching settings or Tk's grab state.
+        now = time.monotonic()
+        if now - self._last_focus_paste_time <= 1.0:
+            return
         if self.app.settings.get(
             "auto_paste_on_focus", True
         ) and self.app.grab_current() is None:
-            if time.time() - self._last_focus_paste_time > 1.0:
-                self._last_focus_paste_time = time.time()
-                self.get_and_validate_clipboard_url()
+            self._last_focus_paste_time = now
+            self.get_and_validate_clipboard_url()
 
     def on_global_hotkey_trigger(self):
         self.app.after(0, self.app.on_download_button_click)
@@ -216,35 +521,89 @@ class AppLogic:
             self.global_hotkey_manager.stop_listener()
 
     def run_download_process_threaded_actual(self, **kwargs):
-        """Starts a single media download process in a new thread."""
-        platform = detect_platform(kwargs["url"])
+        """
+        Starts a single media download process on the download worker pool and
+        returns its download id. When the worker returns, MSG_DOWNLOAD_WORKER_DONE
+        is posted for that id, with the exception if the worker raised.
+        """
+        url = kwargs["url"]
+        download_id = str(uuid.uuid4())
+        platform = (
+            self._last_detected_platform
+            if url == self._last_detected_url
+            else detect_platform(url)
+        )
         thumb_gen_func = (
             extract_album_art_logic
             if kwargs["download_type"] == "Audio"
             else generate_thumbnail_from_video_logic
         )
-        thread = threading.Thread(
-            target=run_download_process,
-            args=(
-                kwargs["url"],
-                platform,
-                kwargs["download_type"],
-                self.app.download_dir,
-                self.app.download_queue,
-                thumb_gen_func,
-            ),
-            kwargs={
-                "selected_format_code": kwargs["selected_format_code"],
-                "download_subtitles": kwargs["download_subtitles"],
-                "subtitle_languages": kwargs["subtitle_languages"],
-                "embed_subtitles": kwargs["embed_subtitles"],
-                "cancel_event": kwargs["cancel_event"],
-                "is_playlist_item": kwargs["is_playlist_item"],
-            },
-            daemon=True,
+        future = self._get_download_executor().submit(
+            run_download_process,
+            url,
+            platform,
+            kwargs["download_type"],
+            self.app.download_dir,
+            self.app.ui_queue,
+            thumb_gen_func,
+            selected_format_code=kwargs["selected_format_code"],
+            download_subtitles=kwargs["download_subtitles"],
+            subtitle_languages=kwargs["subtitle_languages"],
+            embed_subtitles=kwargs["embed_subtitles"],
+            cancel_event=kwargs["cancel_event"],
+            is_playlist_item=kwargs["is_playlist_item"],
+            download_id=download_id,
+        )
+        future.add_done_callback(
+            lambda done: self._on_download_future_done(download_id, done)
         )
-        self.app_threads_list.append(thread)
-        thread.start()
+        # Prune finished futures in place (the list is shared with the app)
+        # so it doesn't keep every past download's arguments alive.
+        self.app_threads_list[:] = [
+            f for f in self.app_threads_list if not f.done()
+        ]
+        self.app_threads_list.append(future)
+        return download_id
+
+    def _on_download_future_done(self, download_id, future):
+        """
+        Runs on the pool thread when a download worker returns. Nothing else
+        reads the future, so a worker exception would otherwise go unseen (and
+        the download's slot stay taken); hand it to the UI thread instead.
+        """
+        if future.cancelled():
+            return  # Dropped by shutdown_workers() on exit
+        error = future.exception()
+        if error is not None:
+            traceback.print_exception(type(error), error, error.__traceback__)
+        try:
+            self.app.ui_queue.put(
+                (MSG_DOWNLOAD_WORKER_DONE, download_id, error),
+                timeout=QUEUE_PUT_TIMEOUT,
+            )
+        except queue.Full:
+            print(f"ERROR: Main queue full. Could not report worker end for {download_id}")
+
+    def _get_download_executor(self):
+        """Returns the download pool, creating it sized to the concurrency cap."""
+        if self._download_executor is None:
+            self._download_executor = ThreadPoolExecutor(
+                max_workers=self.max_parallel_downloads,
+                thread_name_prefix="download_worker",
+            )
+        return self._download_executor
+
+    def shutdown_workers(self):
+        """
+        Stops the shared worker pools and drops their queued jobs. Pool threads
+        are joined at interpreter exit, so leftover jobs would keep the process
+        alive after the window closed; running jobs still finish.
+        """
+        if self._download_executor is not None:
+            self._download_executor.shutdown(wait=False, cancel_futures=True)
+        self._thumbnail_executor.shutdown(wait=False, cancel_futures=True)
+        # Each queued probe is an ffprobe run; don't probe the whole history on exit
+        self._duration_executor.shutdown(wait=False, cancel_futures=True)
 
     def _fetch_playlist_urls(
         self, playlist_url, output_queue, cancel_event: threading.Event
@@ -254,22 +613,17 @@ class AppLogic:
         """
         urls = []
         try:
-            yt_dlp_exe_path = None
-            python_dir = os.path.dirname(sys.executable)
-            scripts_dir = os.path.join(python_dir, "Scripts")
-            if os.path.exists(os.path.join(scripts_dir, "yt-dlp.exe")):
-                yt_dlp_exe_path = os.path.join(scripts_dir, "yt-dlp.exe")
-            elif os.path.exists(os.path.join(scripts_dir, "yt-dlp")):
-                yt_dlp_exe_path = os.path.join(scripts_dir, "yt-dlp")
-
-            command_base = (
-                [yt_dlp_exe_path]
-                if yt_dlp_exe_path
-                else [sys.executable, "-m", "yt_dlp"]
-            )
-            command = command_base + [
+            if YT_DLP_COMMAND_BASE is None:
+                output_queue.put(
+                    LOG_ERROR_PREFIX
+                    + "yt-dlp executable not found in the application bundle."
+                )
+                return None
+            command = YT_DLP_COMMAND_BASE + [
                 "--flat-playlist",
-                "--print-json",
+                # Only the entry URL is needed; skip yt-dlp's per-entry JSON dump
+                "--print",
+                "url",
                 playlist_url,
             ]
 
@@ -277,44 +631,58 @@ class AppLogic:
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                creationflags=get_subprocess_startupinfo().dwFlags
-                if sys.platform.startswith("win")
-                else 0,
-                startupinfo=get_subprocess_startupinfo()
-                if sys.platform.startswith("win")
-                else None,
-                env=os.environ.copy(),
+                **POPEN_PLATFORM_KWARGS,
             )
-
-            for line in iter(process.stdout.readline, ""):
+            # Drain stderr concurrently so a chatty yt-dlp can't fill that pipe
+            # and stall while we're still reading stdout.
+            stderr_output = bytearray()
+            stderr_reader = threading.Thread(
+                target=self._drain_pipe,
+                args=(process.stderr, stderr_output),
+                daemon=True,
+                name="playlist_fetch_stderr",
+            )
+            stderr_reader.start()
+
+            # Read the pipe in large binary chunks and split lines in bulk rather
+            # than paying a Python-level readline() + decode per entry.
+            partial_line = b""
+            last_reported_count = 0
+            last_report_time = time.monotonic()
+            while True:
                 if cancel_event.is_set():
                     process.terminate()
                     return None
-                try:
-                    entry_data = json.loads(line)
-                    if entry_data.get("url"):
-                        urls.append(entry_data["url"])
-                        self.app.after(
-                            0,
-                            lambda total=len(urls): self.app.progress_details_label.configure(
-                                text=f"Fetched {total} items from playlist..."
-                            ),
-                        )
-                except json.JSONDecodeError:
-                    output_queue.put(
-                        f"{MSG_LOG_PREFIX} (Playlist Fetch) {line.strip()}"
-                    )
+                chunk = process.stdout.read1(PLAYLIST_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                lines = (partial_line + chunk).split(b"\n")
+                partial_line = lines.pop()
+                for line in lines:
+                    self._collect_playlist_entry(line, urls)
+
+                now = time.monotonic()
+                if (
+                    len(urls) != last_reported_count
+                    and now - last_report_time > PLAYLIST_PROGRESS_INTERVAL
+                ):
+                    self._show_playlist_fetch_progress(len(urls))
+                    last_reported_count = len(urls)
+                    last_report_time = now
+
+            self._collect_playlist_entry(partial_line, urls)
+            if len(urls) != last_reported_count:
+                self._show_playlist_fetch_progress(len(urls))
 
             process.stdout.close()
             return_code = process.wait()
+            stderr_reader.join()
 
             if return_code != 0:
-                stderr_output = process.stderr.read()
                 output_queue.put(
-                    f"{MSG_LOG_PREFIX} ERROR: Playlist fetch failed. Stderr: {stderr_output}"
+                    LOG_ERROR_PREFIX
+                    + "Playlist fetch failed. Stderr: "
+                    + stderr_output.decode("utf-8", "replace")
                 )
                 return None
 
@@ -322,10 +690,41 @@ class AppLogic:
 
         except Exception as e:
             output_queue.put(
-                f"{MSG_LOG_PREFIX} ERROR: Unexpected error fetching playlist: {e}"
+                LOG_ERROR_PREFIX + f"Unexpected error fetching playlist: {e}"
             )
             return None
 
+    @staticmethod
+    def _drain_pipe(pipe, sink):
+        """Reads a binary pipe to EOF, appending everything to the sink bytearray."""
+        with pipe:
+            for chunk in iter(lambda: pipe.read1(PLAYLIST_READ_CHUNK_SIZE), b""):
+                sink += chunk
+
+    def _collect_playlist_entry(self, line, urls):
+        """Appends the URL from one '--print url' line, skipping entries without one."""
+        line = line.strip()
+        # yt-dlp prints "NA" for entries that have no URL
+        if line and line != b"NA":
+            urls.append(line.decode("utf-8", "replace"))
+
+    def _show_playlist_fetch_progress(self, total):
+        """
+        Publishes the latest fetched-item count to the UI. At most one label
+        update is pending at a time; it always shows the newest count.
+        """
+        self._playlist_fetch_count = total
+        if not self._playlist_progress_update_pending:
+            self._playlist_progress_update_pending = True
+            self.app.after(0, self._apply_playlist_fetch_progress)
+
+    def _apply_playlist_fetch_progress(self):
+        self._playlist_progress_update_pending = False
+        if self.app.progress_details_label.winfo_exists():
+            self.app.progress_details_label.configure(
+                text=f"Fetched {self._playlist_fetch_count} items from playlist..."
+            )
+
     def run_playlist_download_threaded(
         self, playlist_url, cancel_event: threading.Event
     ):
@@ -333,44 +732,44 @@ class AppLogic:
 
         def playlist_worker():
             playlist_urls = self._fetch_playlist_urls(
-                playlist_url, self.app.download_queue, cancel_event
+                playlist_url, self.app.ui_queue, cancel_event
             )
 
             if playlist_urls is None:
                 self.app.log_message("Playlist URL fetching aborted or failed.")
                 return
 
-            self.current_playlist_download_info["total_items"] = len(
-                playlist_urls
-            )
-            self.app.log_message(
-                f"Found {len(playlist_urls)} videos. Queuing for download."
+            # The remaining work is cheap and touches Tk state (download type
+            # variable), so hand it to the UI thread and let this worker exit.
+            self.app.after(
+                0, lambda: self._queue_playlist_items(playlist_urls, cancel_event)
             )
 
-            for i, url in enumerate(playlist_urls):
-                if cancel_event.is_set():
-                    self.app.log_message("Playlist queuing cancelled by user.")
-                    break
+        threading.Thread(target=playlist_worker, daemon=True).start()
 
-                self.app.pending_downloads.put(
-                    {
-                        "url": url,
-                        "download_type": self.app.download_type_var.get(),
-                        "selected_format_code": "best",
-                        "download_subtitles": self.app.settings.get(
-                            "download_subtitles", False
-                        ),
-                        "subtitle_languages": self.app.settings.get(
-                            "subtitle_languages", "en"
-                        ),
-                        "embed_subtitles": self.app.settings.get(
-                            "embed_subtitles", True
-                        ),
-                        "is_playlist_item": True,
-                        "title": f"Item {i+1}",
-                        "cancel_event": cancel_event,
-                    }
-                )
-            self.app.after(0, self.app.start_next_download_if_available)
+    def _queue_playlist_items(self, playlist_urls, cancel_event: threading.Event):
+        """Queues fetched playlist URLs for download. Runs on the Tk thread."""
+        self.current_playlist_download_info["total_items"] = len(playlist_urls)
+        self.app.log_message(
+            f"Found {len(playlist_urls)} videos. Queuing for download."
+        )
 
-        threading.Thread(target=playlist_worker, daemon=True).start()
\ No newline at end of file
+        # Fields shared by every item, read from the UI/settings once
+        base_item = {
+            "download_type": self.app.download_type_var.get(),
+            "selected_format_code": "best",
+            "download_subtitles": self.app.settings.get("download_subtitles", False),
+            "subtitle_languages": self.app.settings.get("subtitle_languages", "en"),
+            "embed_subtitles": self.app.settings.get("embed_subtitles", True),
+            "is_playlist_item": True,
+            "cancel_event": cancel_event,
+        }
+        for i, url in enumerate(playlist_urls):
+            if cancel_event.is_set():
+                self.app.log_message("Playlist queuing cancelled by user.")
+                break
+
+            self.app.pending_downloads.put(
+                {**base_item, "url": url, "title": f"Item {i+1}"}
+            )
+        self.app.start_next_download_if_available()
@@ -6,16 +6,45 @@ import sys
 import json
 import threading
 import shlex
+import time
+from collections import OrderedDict
+
+try:
+    # Optional: orjson parses yt-dlp's large --dump-json document several times faster.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 from constants import FFMPEG_TIMEOUT, MSG_LOG_PREFIX
+from utils import POPEN_PLATFORM_KWARGS
 # Import the specific window for type hinting or direct usage
 from ui_elements.format_selection_window import FormatSelectionWindow 
 
+# Options for the in-process yt-dlp format query (metadata only, single video)
+YDL_FORMAT_QUERY_OPTIONS = {
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "noplaylist": True,
+    "socket_timeout": FFMPEG_TIMEOUT,
+}
+# Placeholder shown for format fields yt-dlp leaves empty
+NO_VALUE = "-"
+# Parsed format lists are reused for the same URL for this long (seconds)
+FORMAT_CACHE_TTL = 600
+FORMAT_CACHE_MAX_ENTRIES = 32
+
+
+def _preview(output):
+    """Decodes the start of a subprocess's byte output for an error message."""
+    return output.strip()[:200].decode('utf-8', 'replace')
+
 
 class FormatFetcher:
     def __init__(self, app_instance):
         self.app = app_instance
         self.format_fetch_thread = None
+        self._format_cache = OrderedDict()  # url -> (fetched_at, parsed formats)
 
     def get_available_formats(self):
         """Initiates fetching of available formats for the entered URL."""
@@ -23,6 +52,11 @@ class FormatFetcher:
         if not url:
             self.app.messagebox.showwarning("No URL", "Please enter a media URL first.", parent=self.app)
             return
+        cached_formats = self._get_cached_formats(url)
+        if cached_formats:
+            self.app.log_message(f"Using recently fetched formats for: {url}")
+            self.app.open_format_selection_window(cached_formats)
+            return
         if self.format_fetch_thread and self.format_fetch_thread.is_alive():
             self.app.log_message("Format fetching already in progress.")
             return
@@ -33,8 +67,53 @@ class FormatFetcher:
         )
         self.format_fetch_thread.start()
 
+    def _get_cached_formats(self, url):
+        """Returns the parsed formats fetched for url within the TTL, if any."""
+        entry = self._format_cache.get(url)
+        if entry is None:
+            return None
+        fetched_at, parsed_formats = entry
+        if time.monotonic() - fetched_at >= FORMAT_CACHE_TTL:
+            del self._format_cache[url]
+            return None
+        return parsed_formats
+
+    def cache_formats(self, url, parsed_formats):
+        """Remembers a parsed format list, evicting the oldest entry past the cap."""
+        self._format_cache.pop(url, None)
+        self._format_cache[url] = (time.monotonic(), parsed_formats)
+        while len(self._format_cache) > FORMAT_CACHE_MAX_ENTRIES:
+            self._format_cache.popitem(last=False)
+
+    def _post_result(self, message):
+        """
+        Queues a fetch result and asks Tk to drain the UI queue right away,
+        so the format window doesn't wait for the next periodic poll.
+        """
+        self.app.ui_queue.put(message)
+        self.app.after(0, self.app.drain_ui_queue)
+
     def _fetch_formats_thread_target(self, url):
-        """Thread target for running yt-dlp to list formats."""
+        """
+        Thread target for listing formats. Uses the yt_dlp module in-process
+        when it's importable (no interpreter start-up or JSON round trip),
+        otherwise runs the yt-dlp executable.
+        """
+        try:
+            import yt_dlp
+        except ImportError:
+            self._fetch_formats_subprocess(url)
+            return
+        try:
+            # A fresh copy per fetch: YoutubeDL keeps and may modify its params
+            with yt_dlp.YoutubeDL(dict(YDL_FORMAT_QUERY_OPTIONS)) as ydl:
+                info = ydl.extract_info(url, download=False)
+            self._post_result(("FORMAT_DICT_DATA", url, info))
+        except Exception as e:
+            self._post_result(("FORMAT_ERROR", f"Error fetching formats: {type(e).__name__} - {e}"))
+
+    def _fetch_formats_subprocess(self, url):
+        """Lists formats by running yt-dlp --dump-json as a subprocess."""
         try:
             # Determine yt-dlp executable path for robustness
             yt_dlp_exe_path = None
@@ -63,53 +142,51 @@ class FormatFetcher:
             else:
                 command_base = [sys.executable, "-m", "yt_dlp"]
             
-            command = command_base + ["--list-formats", "--dump-json", url]
+            # --dump-json alone: --list-formats would only add a human-readable table
+            command = command_base + ["-q", "--no-warnings", "--dump-json", "--no-playlist", url]
 
-            self.app.format_info_queue.put(
-                (MSG_LOG_PREFIX, f"Executing for formats: {shlex.join(command)}")
+            self.app.ui_queue.put(
+                (MSG_LOG_PREFIX, f"(FormatFetch) Executing for formats: {shlex.join(command)}")
             )
             process = subprocess.Popen(
                 command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                text=True, encoding='utf-8', errors='replace',
-                creationflags=0x08000000 if sys.platform.startswith('win') else 0 # CREATE_NO_WINDOW
+                **POPEN_PLATFORM_KWARGS # Bytes: the JSON parser decodes UTF-8 itself
             )
             stdout, stderr = process.communicate(timeout=FFMPEG_TIMEOUT)
 
             if process.returncode == 0 and stdout:
-                # yt-dlp might output multiple JSON objects for playlists or related.
-                # We typically want the main video's info, often the first one.
-                # Find the first complete JSON object and pass it for parsing.
-                json_lines = [
-                    line for line in stdout.strip().splitlines()
-                    if line.strip().startswith("{") and line.strip().endswith("}")
-                ]
-                if json_lines:
-                    self.app.format_info_queue.put(("FORMAT_JSON_DATA", json_lines[0]))
+                # --dump-json writes one JSON object per line (newlines inside it
+                # are escaped); decode the first one here, off the UI thread.
+                try:
+                    info = json_loads(stdout.lstrip().partition(b"\n")[0])
+                except ValueError: # JSONDecodeError, or UnicodeDecodeError for bad UTF-8
+                    info = None
+                if isinstance(info, dict):
+                    self._post_result(("FORMAT_DICT_DATA", url, info))
                 else:
-                    self.app.format_info_queue.put(
-                        ("FORMAT_ERROR", f"No valid JSON object found in yt-dlp output. Output: {stdout.strip()[:200]}...")
+                    self._post_result(
+                        ("FORMAT_ERROR", f"No valid JSON object found in yt-dlp output. Output: {_preview(stdout)}...")
                     )
             else:
                 error_msg = f"yt-dlp exited with {process.returncode}. "
                 if stdout:
-                    error_msg += f"Output: {stdout.strip()[:200]}... "
+                    error_msg += f"Output: {_preview(stdout)}... "
                 if stderr:
-                    error_msg += f"Stderr: {stderr.strip()[:200]}..."
+                    error_msg += f"Stderr: {_preview(stderr)}..."
                 if not stdout and not stderr:
                     error_msg = f"Failed to fetch formats (yt-dlp code {process.returncode}, no stdout/stderr)."
-                self.app.format_info_queue.put(("FORMAT_ERROR", error_msg))
+                self._post_result(("FORMAT_ERROR", error_msg))
         except subprocess.TimeoutExpired:
-            self.app.format_info_queue.put(("FORMAT_ERROR", "Timeout fetching formats."))
+            self._post_result(("FORMAT_ERROR", "Timeout fetching formats."))
         except FileNotFoundError:
-            self.app.format_info_queue.put(("FORMAT_ERROR", "yt-dlp (or python) not found for format fetching. Ensure yt-dlp is installed and in PATH, or install with 'pip install yt-dlp'."))
+            self._post_result(("FORMAT_ERROR", "yt-dlp (or python) not found for format fetching. Ensure yt-dlp is installed and in PATH, or install with 'pip install yt-dlp'."))
         except Exception as e:
-            self.app.format_info_queue.put(("FORMAT_ERROR", f"Error fetching formats: {type(e).__name__} - {e}"))
+            self._post_result(("FORMAT_ERROR", f"Error fetching formats: {type(e).__name__} - {e}"))
 
-    def _parse_formats_json(self, json_string):
-        """Parses the JSON output from yt-dlp to extract format information."""
+    def _parse_formats_dict(self, data):
+        """Extracts the format list from a yt-dlp info dict."""
         parsed_formats_list = []
         try:
-            data = json.loads(json_string)
             raw_formats = data.get("formats")
             if not raw_formats:
                 self.app.log_message(f"No 'formats' array found in JSON. Data: {str(data)[:200]}...")
@@ -118,60 +195,66 @@ class FormatFetcher:
                 self.app.log_message(f"'formats' is not a list. Type: {type(raw_formats)}. Data: {str(raw_formats)[:200]}...")
                 return []
 
+            format_filesize = self.app.history_manager._format_filesize
+            filesize_labels = {}  # Many formats report the same size; format each once
             for fmt_json in raw_formats:
                 if not isinstance(fmt_json, dict):
                     continue
 
-                def get_val(key, default="-"):
-                    return fmt_json.get(key, default) if fmt_json.get(key) is not None else default
-
+                # Pull each field once; None (missing or null) falls back to a default
+                get = fmt_json.get
+                width, height, tbr = get("width"), get("height"), get("tbr")
+                raw_vcodec, raw_acodec = get("vcodec"), get("acodec")
+                resolution = get("resolution")
+                if resolution is None: # Only build a fallback when yt-dlp gave none
+                    if width:
+                        resolution = f"{width}x{'' if height is None else height}"
+                    else:
+                        resolution = "audio only" if raw_vcodec == "none" else NO_VALUE
+                note = get("format_note")
+                filesize = get("filesize") or get("filesize_approx")
+                filesize_label = filesize_labels.get(filesize)
+                if filesize_label is None:
+                    filesize_label = filesize_labels[filesize] = format_filesize(filesize)
                 fmt_entry = {
-                    "id": get_val("format_id"), "ext": get_val("ext"),
-                    "resolution": get_val("resolution", f"{get_val('width', '')}x{get_val('height', '')}" if get_val('width') else "audio only"),
-                    "fps": get_val("fps"),
-                    "vcodec": get_val("vcodec", "none").split('.')[0], # Remove any '.' from codec name
-                    "acodec": get_val("acodec", "none").split('.')[0],
-                    "tbr": f"{get_val('tbr', '?')}k" if get_val('tbr', '?') != '?' and get_val('tbr') is not None else get_val('tbr', '-'),
-                    "filesize": self.app.history_manager._format_filesize(fmt_json.get("filesize") or fmt_json.get("filesize_approx")), # Reuse filesize formatter
-                    "note": get_val("format_note", ""),
-                    "protocol": get_val("protocol"),
-                    "channels": get_val("audio_channels", "-")
+                    "id": NO_VALUE if (v := get("format_id")) is None else v,
+                    "ext": NO_VALUE if (v := get("ext")) is None else v,
+                    "resolution": resolution,
+                    "fps": NO_VALUE if (v := get("fps")) is None else v,
+                    "vcodec": ("none" if raw_vcodec is None else raw_vcodec).split('.', 1)[0], # Remove any '.' from codec name
+                    "acodec": ("none" if raw_acodec is None else raw_acodec).split('.', 1)[0],
+                    "tbr": NO_VALUE if tbr is None else f"{tbr}k",
+                    "filesize": filesize_label, # Reuse filesize formatter
+                    "note": "" if note is None else note,
+                    "protocol": NO_VALUE if (v := get("protocol")) is None else v,
+                    "channels": NO_VALUE if (v := get("audio_channels")) is None else v,
                 }
-                if fmt_json.get("dynamic_range"):
-                    fmt_entry["note"] = f"{fmt_entry['note']} ({fmt_json['dynamic_range']})".strip()
+                if dynamic_range := get("dynamic_range"):
+                    fmt_entry["note"] = f"{fmt_entry['note']} ({dynamic_range})".strip()
                 # Refine resolution/note for audio-only or video-only formats
                 if fmt_entry["vcodec"] == "none" and fmt_entry["acodec"] != "none":
                     fmt_entry["resolution"] = "audio only"
-                elif fmt_json.get("acodec") == "none" and fmt_json.get("vcodec") != "none":
+                elif raw_acodec == "none" and raw_vcodec != "none":
                     if not fmt_entry["note"] and fmt_entry["resolution"] != "audio only":
                         fmt_entry["note"] = "video only"
-                parsed_formats_list.append(fmt_entry)
 
-            # Sort formats by bitrate (tbr) and then by height (resolution)
-            def sort_key(fmt):
-                try:
-                    tbr_val = float(str(fmt.get("tbr", "0")).replace('k', '').replace('K','').replace('B/s', '')) if fmt.get("tbr") and fmt.get("tbr") != '-' else 0
-                except ValueError:
-                    tbr_val = 0
-                try:
-                    res_str = str(fmt.get("resolution", "0x0"))
-                    height_val = 0
-                    if 'x' in res_str:
-                        try: height_val = int(res_str.split('x')[-1])
-                        except ValueError: pass
-                    elif res_str == "audio only":
-                        height_val = 0
-                    else: # Other resolution strings or "video only"
-                        height_val = -1 # A small negative value to sort below real resolutions but above 0 for audio only
-                except ValueError:
-                    height_val = 0
-                return (-tbr_val, -height_val, fmt.get("id")) # Descending bitrate, descending height, then ID
-
-            parsed_formats_list.sort(key=sort_key)
-        except json.JSONDecodeError as e:
-            self.app.log_message(f"JSONDecodeError: {e}. Data: {json_string[:200]}...");
-            return []
+                # Sort by bitrate, then height, taken from the raw numbers here
+                # rather than parsed back out of the display strings later
+                sort_tbr = tbr if isinstance(tbr, (int, float)) else 0
+                if fmt_entry["resolution"] == "audio only":
+                    sort_height = 0
+                elif isinstance(height, int):
+                    sort_height = height
+                else:
+                    sort_height = -1  # Below real resolutions, above audio only
+                parsed_formats_list.append(
+                    ((-sort_tbr, -sort_height, fmt_entry["id"]), fmt_entry)
+                )
+
+            # Descending bitrate, descending height, then ID
+            if len(parsed_formats_list) > 1:
+                parsed_formats_list.sort(key=lambda keyed: keyed[0])
         except Exception as e:
             self.app.log_message(f"Error processing formats JSON: {type(e).__name__} - {e}");
             return []
-        return parsed_formats_list
\ No newline at end of file
+        return [fmt_entry for _, fmt_entry in parsed_formats_list]
\ No newline at end of file
@@ -1,6 +1,12 @@
 import customtkinter as ctk
+from tkinter import ttk
 from tkinter import StringVar as tkStringVar # Keep tk import for StringVar
 
+from utils import get_ctk_color_from_theme_path
+
+# Treeview tag tuples for alternating row shades, indexed by row parity
+ROW_STRIPE_TAGS = (("even",), ("odd",))
+
 class FormatSelectionWindow(ctk.CTkToplevel):
     def __init__(self, master, app_instance, formats_data):
         super().__init__(master)
@@ -33,62 +39,30 @@ class FormatSelectionWindow(ctk.CTkToplevel):
             {"text": "Note", "key": "note", "width": 150, "stretch": True},
         ]
 
-        header_frame = ctk.CTkFrame(self, fg_color="transparent")
-        header_frame.pack(pady=(10,0), fill="x", padx=10)
+        # One native Treeview draws every row (instead of a frame, a radio button
+        # and a label per column for each format); its selection is the choice.
+        # The ttk theme is app-wide, so only switch it if it isn't set yet.
+        self._style = ttk.Style(self)
+        if self._style.theme_use() != "default":
+            self._style.theme_use("default")
 
-        # For Radiobutton column header (empty label but occupies space)
-        ctk.CTkLabel(header_frame, text="", font=self.app.ui_font_bold, width=30).pack(side="left", padx=(0,5))
+        tree_frame = ctk.CTkFrame(self, fg_color="transparent")
+        tree_frame.pack(expand=True, fill="both", padx=10, pady=(10, 5))
 
-        # Create column headers
+        self._column_keys = tuple(c["key"] for c in self.headers_config)  # Shared by every row
+        self.format_tree = ttk.Treeview(tree_frame, columns=self._column_keys,
+                                        show="headings", selectmode="browse", style="Formats.Treeview")
         for config in self.headers_config:
-            lbl_width = config["width"]
-            header_lbl = ctk.CTkLabel(header_frame, text=config["text"], font=self.app.ui_font_bold,
-                                      width=lbl_width, anchor="w")
-            header_lbl.pack(side="left", padx=3, fill="x" if config.get("stretch") else None, expand=config.get("stretch", False))
-
-        scrollable_frame = ctk.CTkScrollableFrame(self)
-        scrollable_frame.pack(expand=True, fill="both", padx=10, pady=5)
-
-        # "Best" option radio button
-        best_option_frame = ctk.CTkFrame(scrollable_frame, fg_color="transparent")
-        best_option_frame.pack(fill="x", pady=2)
-        ctk.CTkRadioButton(
-            best_option_frame, text=" Best (yt-dlp default)", variable=self.selected_format_code_var,
-            value="best", font=self.app.ui_font
-        ).pack(side="left", anchor="w", padx=5)
+            self.format_tree.heading(config["key"], text=config["text"], anchor="w")
+            self.format_tree.column(config["key"], width=config["width"], minwidth=config["width"],
+                                    anchor="w", stretch=config.get("stretch", False))
 
-        if not formats_data:
-            ctk.CTkLabel(scrollable_frame, text="No specific formats found or error fetching formats.", font=self.app.ui_font).pack(pady=20)
-        else:
-            for i, fmt_entry in enumerate(formats_data):
-                row_fg_color = "gray35" if i % 2 == 0 else "gray30"
-                if ctk.get_appearance_mode() == "Light":
-                    row_fg_color = "gray85" if i % 2 == 0 else "gray80" # Lighter shades for light mode
-
-                row_frame = ctk.CTkFrame(scrollable_frame, fg_color=row_fg_color)
-                row_frame.pack(fill="x", pady=1, ipady=2)
-
-                rb_value = fmt_entry.get('id', f'unknown_{i}') # Use format_id as value
-                rb = ctk.CTkRadioButton(row_frame, text="", variable=self.selected_format_code_var,
-                                        value=rb_value, width=20)
-                rb.pack(side="left", padx=(5,5))
-
-                for config in self.headers_config:
-                    detail_text = str(fmt_entry.get(config["key"], "-"))
-                    lbl_width = config["width"]
-
-                    # Truncate text if it's too long for the column width
-                    # This is a heuristic, adjust as needed
-                    if not config.get("stretch") and lbl_width > 0:
-                         # Calculate max characters based on rough char width (e.g., 6 pixels per char for a 12pt font)
-                         # This is very approximate and depends on font and actual characters
-                         max_chars = int(lbl_width / (self.app.ui_font.cget("size") * 0.6)) if self.app.ui_font.cget("size") > 0 else 10
-                         if len(detail_text) > max_chars + 3: # +3 for "..."
-                             detail_text = detail_text[:max_chars] + "..."
-
-                    lbl = ctk.CTkLabel(row_frame, text=detail_text, font=self.app.ui_font,
-                                       anchor="w", width=lbl_width)
-                    lbl.pack(side="left", padx=3, fill="x" if config.get("stretch") else None, expand=config.get("stretch", False))
+        scrollbar = ctk.CTkScrollbar(tree_frame, command=self.format_tree.yview)
+        self.format_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.format_tree.pack(side="left", expand=True, fill="both")
+
+        self.format_tree.bind("<<TreeviewSelect>>", self._on_tree_select)
 
         button_frame = ctk.CTkFrame(self)
         button_frame.pack(fill="x", padx=10, pady=(5,10))
@@ -99,17 +73,84 @@ class FormatSelectionWindow(ctk.CTkToplevel):
         reset_button = ctk.CTkButton(button_frame, text="Reset to Best", command=self.on_reset_to_best, font=self.app.ui_font)
         reset_button.pack(side="left", padx=5)
 
-        cancel_button = ctk.CTkButton(button_frame, text="Cancel", command=self.destroy, font=self.app.ui_font)
+        cancel_button = ctk.CTkButton(button_frame, text="Cancel", command=self.hide, font=self.app.ui_font)
         cancel_button.pack(side="right", padx=5)
 
+        # The window is kept and reused for later fetches: closing only hides it
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+        self.repopulate(formats_data)
+
+    def _apply_style(self):
+        """Applies the current appearance mode and UI font to the format list."""
+        is_light = ctk.get_appearance_mode() == "Light"
+        row_colors = ("gray85", "gray80") if is_light else ("gray35", "gray30")
+        text_color = get_ctk_color_from_theme_path("CTkLabel.text_color")
+        select_color = get_ctk_color_from_theme_path("CTkButton.fg_color")
+        style = self._style
+        style.configure("Formats.Treeview", background=row_colors[0], fieldbackground=row_colors[0],
+                        foreground=text_color, font=self.app.ui_font, borderwidth=0,
+                        rowheight=self.app.ui_font.metrics("linespace") + 8)
+        style.configure("Formats.Treeview.Heading", font=self.app.ui_font_bold, relief="flat")
+        style.map("Formats.Treeview", background=[("selected", select_color)])
+        self.format_tree.tag_configure("even", background=row_colors[0])
+        self.format_tree.tag_configure("odd", background=row_colors[1])
+
+    def repopulate(self, formats_data):
+        """Replaces the listed formats and re-selects the saved format code."""
+        # The window may be reused after a theme or font size change
+        self._apply_style()
+        self.formats_data = formats_data
+        self.initial_format_code = self.app.settings.get("selected_format_code", "best")
+        self.selected_format_code_var.set(self.initial_format_code)
+        self.format_tree.delete(*self.format_tree.get_children())
+
+        # "Best" option row; format rows use their index as iid since IDs may repeat ("-")
+        self.format_tree.insert("", "end", iid="best", values=["best", "", "Best (yt-dlp default)"])
+        self._row_format_codes = {"best": "best"}
+        if not formats_data:
+            self.format_tree.insert("", "end", values=["", "", "No specific formats found or error fetching formats."])
+        else:
+            for i, fmt_entry in enumerate(formats_data):
+                iid = str(i)
+                self._row_format_codes[iid] = fmt_entry.get('id', f'unknown_{i}') # Use format_id as value
+                self.format_tree.insert("", "end", iid=iid, tags=ROW_STRIPE_TAGS[i & 1],
+                                        values=[str(fmt_entry.get(key, "-")) for key in self._column_keys])
+
+        self._select_format_row(self.initial_format_code)
+
+    def show(self):
+        """Brings the (possibly hidden) window back as a modal dialog."""
+        self.deiconify()
+        self.lift()
+        self.focus()
+        self.grab_set()
+
+    def hide(self):
+        self.grab_release()
+        self.withdraw()
+
     def on_select(self):
         selected_code = self.selected_format_code_var.get()
         self.app.settings["selected_format_code"] = selected_code
         self.app.save_app_settings()
         self.app.ui_manager.update_selected_format_display() # Call through UIManager
         self.app.log_message(f"Selected format code: {selected_code}")
-        self.destroy()
+        self.hide()
+
+    def _select_format_row(self, format_code):
+        """Selects and reveals the row for format_code, if it's listed."""
+        for iid, code in self._row_format_codes.items():
+            if code == format_code:
+                self.format_tree.selection_set(iid)
+                self.format_tree.see(iid)
+                return
+
+    def _on_tree_select(self, _event=None):
+        selection = self.format_tree.selection()
+        if selection and selection[0] in self._row_format_codes:
+            self.selected_format_code_var.set(self._row_format_codes[selection[0]])
 
     def on_reset_to_best(self):
         self.selected_format_code_var.set("best")
+        self._select_format_row("best")
         self.app.log_message("Format selection reset to 'best' in window.")
\ No newline at end of file
@@ -6,10 +6,13 @@ import os
 import datetime
 import sys
 import subprocess
-import pyperclip
+import threading
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 from constants import (
     THUMBNAIL_SIZE,
+    THUMBNAIL_CACHE_SUFFIX,
     VIDEO_EXTENSIONS,
     AUDIO_EXTENSIONS,
     HISTORY_ITEM_SIZES,
@@ -17,145 +20,457 @@ from constants import (
 )
 from utils import get_ctk_color_from_theme_path
 
+# Rows rendered above and below the visible part of the history list, so short
+# scrolls reveal rows that are already filled in
+ROW_OVERSCAN = 3
+# Vertical gap between two history rows (CTk units)
+ROW_GAP = 3
+# Window width change (px) after which the item names are re-wrapped
+NAME_REWRAP_THRESHOLD = 32
+# Lines an item name may wrap to; the fixed row height is measured for this many,
+# and longer names are cut short with an ellipsis
+NAME_MAX_LINES = 2
+NAME_ELLIPSIS = "\u2026"
+
+# UI queue message carrying a finished download folder scan
+MSG_HISTORY_SCAN_DONE = "HISTORY_SCAN_DONE"
+
+# Lowercased extension -> (item type, display prefix) for the folder scan
+MEDIA_TYPE_BY_EXTENSION = {
+    **{ext.lower(): ("video", "[Video]") for ext in VIDEO_EXTENSIONS},
+    **{ext.lower(): ("audio", "[Audio]") for ext in AUDIO_EXTENSIONS},
+}
+
+FILESIZE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
+# Delay (ms) over which history changes are gathered into one row refresh
+REDRAW_COALESCE_MS = 16
+
+# Threads deleting thumbnail files when the thumbnail cache is cleared
+THUMBNAIL_DELETE_WORKERS = 8
+
+
+def _remove_file(path):
+    """
+    Deletes path and returns (path, removed, error). A file that is already
+    gone is not an error; removal is just attempted, with no exists() first.
+    """
+    try:
+        os.remove(path)
+        return path, True, None
+    except FileNotFoundError:
+        return path, False, None
+    except OSError as e:
+        return path, False, e
+
+
+def _longest_fitting_prefix(text, start, measure, width):
+    """Length of the longest prefix of text[start:] that measures at most width."""
+    low, high = 0, len(text) - start
+    while low < high:
+        mid = (low + high + 1) // 2
+        if measure(text[start:start + mid]) <= width:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _fit_text_lines(text, measure, width, max_lines):
+    """
+    Returns text if it word-wraps (greedily, as Tk labels wrap) to at most
+    max_lines lines of width; otherwise the part that fits, ending in an
+    ellipsis on the last line. measure(text) gives a string's width.
+    """
+    if measure(text) <= width:
+        return text
+    start = 0
+    for _ in range(max_lines - 1):
+        fit = _longest_fitting_prefix(text, start, measure, width)
+        end = start + max(fit, 1)
+        if end >= len(text):
+            return text
+        if not text[end].isspace():
+            # Break after the last space on the line; a word wider than the
+            # line is broken where it overflows
+            space = text.rfind(" ", start, end)
+            if space > start:
+                end = space
+        start = end
+        while start < len(text) and text[start].isspace():
+            start += 1
+    if measure(text[start:]) <= width:
+        return text
+    fit = _longest_fitting_prefix(
+        text, start, measure, width - measure(NAME_ELLIPSIS)
+    )
+    return text[: start + fit].rstrip() + NAME_ELLIPSIS
+
 
 class HistoryManager:
+    """
+    Shows the download history as a windowed list: every row has the same
+    height, the rows container is sized for the whole history so the scrollbar
+    stays correct, and only the rows intersecting the viewport have widgets.
+    Those come from a pool and are refilled in place as the list scrolls.
+
+    Tk-thread only: worker threads never touch the history list or its items.
+    Their results (including a folder scan's freshly built item list) arrive
+    through app.ui_queue and are applied here, so no locking is needed.
+    """
+
     def __init__(self, app_instance):
         self.app = app_instance
-        self.history_item_frames = []
-        self.currently_highlighted_item_frame = None
+        self.highlighted_item_index = None
+
+        self._visible_rows = {}  # history index -> row frame currently placed
+        self._rows_by_item_id = {}  # item "_id" -> row frame showing that item
+        self._row_pool = []  # built row frames not placed right now
+        self._row_height = None  # Fixed row height, in CTk units
+        self._row_layout = None  # Label y offsets in a row, see _measure_row_height
+        self._row_pitch = None  # Row height plus gap, in CTk units
+        self._row_pitch_px = None
+        self._render_pending = False
+        self._empty_label = None
+        self._blank_ctk_image = None  # Built on first use, see _get_blank_image
+        self._name_wraplength = self._compute_name_wraplength(self.app.winfo_width())
+        self._fitted_names = {}  # Full name -> name cut to NAME_MAX_LINES lines
+
+        # Row colors from the current theme, refreshed on every full redraw
+        self._item_default_bg = None
+        self._highlight_bg = None
+        self._name_text_color = None
+        self._refresh_theme_colors()
 
         # CORRECTED: Use Menu from tkinter, not ctk
         self.app.history_context_menu = Menu(self.app, tearoff=0)
-        self.app.history_scrollable_frame.grid_columnconfigure(0, weight=1)
+        self._context_menu_built = False
+        self._context_menu_font = None  # Font the menu entries were built with
+        self._ctx_index = None  # History index the context menu was opened on
+        self._scan_generation = 0  # Bumped per folder scan; older results are dropped
+
+        # Items get a stable "_id" when created; background results (durations,
+        # thumbnails) address items by it, as list indices shift on insert/remove
+        self._item_ids = itertools.count()
+        self._items_by_id = {}
+
+        # A burst of changes (e.g. a playlist finishing) is shown by one refresh
+        self._pending_redraw = False
+        self._pending_thumbnail_scan = False
+
+        scrollable_frame = self.app.history_scrollable_frame
+        scrollable_frame.grid_columnconfigure(0, weight=1)
+
+        self._rows_container = ctk.CTkFrame(scrollable_frame, fg_color="transparent")
+        self._canvas = self._watch_scrollable_frame(scrollable_frame)
+        self.app.bind("<Configure>", self._on_app_resize, add="+")
+
+    def _watch_scrollable_frame(self, scrollable_frame):
+        """
+        Hooks _on_viewport_change into the CTkScrollableFrame's view changes and
+        returns its canvas (which rendering needs to know what is in view).
+
+        CTkScrollableFrame doesn't expose either, so this relies on its private
+        _parent_canvas and _scrollbar attributes (customtkinter 5.2.x, as pinned
+        in requirements.txt). Every view change (wheel, scrollbar drag, resize,
+        list length change) goes through the canvas' yscrollcommand, which CTk
+        points at _scrollbar.set; we wrap that.
+        """
+        canvas = getattr(scrollable_frame, "_parent_canvas", None)
+        scrollbar = getattr(scrollable_frame, "_scrollbar", None)
+        if canvas is None or scrollbar is None:
+            raise RuntimeError(
+                "Unsupported customtkinter version: the history list needs "
+                "CTkScrollableFrame._parent_canvas and ._scrollbar (5.2.x)."
+            )
+        scrollbar_set = scrollbar.set
+
+        def on_yview(first, last):
+            scrollbar_set(first, last)
+            self._on_viewport_change()
+
+        canvas.configure(yscrollcommand=on_yview)
+        canvas.bind("<Configure>", self._on_viewport_change, add="+")
+        return canvas
 
     def _clear_history_display(self):
-        """Destroys all history item UI frames."""
-        for frame in self.history_item_frames:
+        """Destroys all history row frames, pooled ones included."""
+        for frame in [*self._visible_rows.values(), *self._row_pool]:
             if frame.winfo_exists():
                 frame.destroy()
-        self.history_item_frames.clear()
-        self.currently_highlighted_item_frame = None
+        self._visible_rows.clear()
+        self._rows_by_item_id.clear()
+        self._row_pool.clear()
+        self._row_height = self._row_pitch = self._row_pitch_px = None
+        self._row_layout = None
+        if self._empty_label is not None and self._empty_label.winfo_exists():
+            self._empty_label.destroy()
+        self._empty_label = None
 
     def redraw_history_listbox(self):
         """
-        Redraws the entire history list. Should be used for major changes
-        like theme swaps or initial load.
+        Rebuilds the history rows from scratch. Should be used for major changes
+        like theme swaps, font or item size changes, or the initial load; a list
+        change alone only needs _refresh_history_rows.
         """
         self._clear_history_display()
+        self._refresh_theme_colors()
+        self._name_wraplength = self._compute_name_wraplength(self.app.winfo_width())
+        self._fitted_names.clear()  # The font may have changed too
+        self._refresh_history_rows()
 
-        if not self.app.history_items_with_paths:
-            no_items_label = ctk.CTkLabel(
-                self.app.history_scrollable_frame,
-                text="No history items to display.",
-                font=self.app.ui_font,
-            )
-            no_items_label.pack(pady=20, padx=10, anchor="center")
-            self.history_item_frames.append(no_items_label)
-            return
+        # Kick off a single background thumbnail load for the whole history
+        self._queue_missing_thumbnails_for_load()
 
-        for index, item_data in enumerate(self.app.history_items_with_paths):
-            self._create_and_insert_history_item_ui(item_data, index)
+    def _refresh_theme_colors(self):
+        """Looks up the row colors once, instead of walking the theme per row or click."""
+        self._item_default_bg = get_ctk_color_from_theme_path("CTkFrame.fg_color")
+        self._highlight_bg = get_ctk_color_from_theme_path("CTkButton.hover_color")
+        self._name_text_color = get_ctk_color_from_theme_path("CTkLabel.text_color")
 
-        # After creating all frames, kick off a single background thumbnail load
-        self._queue_missing_thumbnails_for_load()
+    def _schedule_redraw(self, thumbnails=False):
+        """
+        Refreshes the rows REDRAW_COALESCE_MS from now, together with any other
+        change made until then. With thumbnails, missing thumbnails are queued too.
+        """
+        self._pending_thumbnail_scan |= thumbnails
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self.app.after(REDRAW_COALESCE_MS, self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._pending_redraw = False
+        self._refresh_history_rows()
+        if self._pending_thumbnail_scan:
+            self._pending_thumbnail_scan = False
+            self._queue_missing_thumbnails_for_load()
 
-    def _create_and_insert_history_item_ui(self, item_data, index):
-        """Creates a single history item frame and inserts it into the display at a given index."""
+    def _refresh_history_rows(self):
+        """Resizes the rows container for the current history and refills the visible rows."""
         if not self.app.history_scrollable_frame.winfo_exists():
             return
+        item_count = len(self.app.history_items_with_paths)
+
+        if not item_count:
+            for frame in self._visible_rows.values():
+                self._release_row(frame)
+            self._visible_rows.clear()
+            self._rows_container.pack_forget()
+            if self._empty_label is None:
+                self._empty_label = ctk.CTkLabel(
+                    self.app.history_scrollable_frame,
+                    text="No history items to display.",
+                    font=self.app.ui_font,
+                )
+                self._empty_label.pack(pady=20, padx=10, anchor="center")
+            return
 
-        item_default_bg = get_ctk_color_from_theme_path("CTkFrame.fg_color")
-        current_item_ipady = HISTORY_ITEM_SIZES.get(
+        if self._empty_label is not None:
+            self._empty_label.destroy()
+            self._empty_label = None
+        if self._row_pitch is None:
+            self._measure_row_height()
+        self._rows_container.configure(height=item_count * self._row_pitch)
+        if not self._rows_container.winfo_manager():
+            self._rows_container.pack(fill="x", anchor="n")
+        self._render_visible_rows(refill=True)
+
+    def _measure_row_height(self):
+        """
+        Builds the first pooled row and measures it. The name is given
+        NAME_MAX_LINES lines; _fit_name keeps every name within that many.
+        """
+        probe_row = self._build_row()
+        probe_row._name_label.configure(text="\n".join("X" * NAME_MAX_LINES))
+        probe_row.update_idletasks()
+        scaling = ctk.ScalingTracker.get_widget_scaling(self._rows_container)
+        item_ipady = HISTORY_ITEM_SIZES.get(
             self.app.settings.get(
                 "history_item_size_name", DEFAULT_HISTORY_ITEM_SIZE_NAME
             ),
             HISTORY_ITEM_SIZES[DEFAULT_HISTORY_ITEM_SIZE_NAME],
         )
-
-        item_frame = ctk.CTkFrame(
-            self.app.history_scrollable_frame,
-            corner_radius=3,
-            fg_color=item_default_bg,
-        )
-        # Use pack's 'before' or 'after' to insert at the correct position
-        if index == 0 or not self.history_item_frames:
-            item_frame.pack(
-                fill="x", pady=(1, 2), padx=2, ipady=current_item_ipady, anchor="n"
+        thumb_height, name_height, duration_height, size_date_height = (
+            label.winfo_reqheight() / scaling
+            for label in (
+                probe_row._thumb_label,
+                probe_row._name_label,
+                probe_row._duration_label,
+                probe_row._size_date_label,
             )
-        else:
-            # Find the widget to pack before. If index is out of bounds, packs at end.
-            sibling = (
-                self.history_item_frames[index]
-                if index < len(self.history_item_frames)
-                else None
-            )
-            item_frame.pack(
-                fill="x",
-                pady=(1, 2),
-                padx=2,
-                ipady=current_item_ipady,
-                before=sibling,
-                anchor="n",
+        )
+        # Thumbnail on the left, the three text lines stacked to its right, both
+        # with 3 units of padding and centered in the row, as the grid had them
+        thumb_block = thumb_height + 6
+        text_block = name_height + duration_height + size_date_height + 6
+        content_height = max(thumb_block, text_block)
+        thumb_y = item_ipady + (content_height - thumb_block) / 2 + 3
+        name_y = item_ipady + (content_height - text_block) / 2 + 3
+        self._row_layout = (
+            thumb_y,
+            name_y,
+            name_y + name_height,
+            name_y + name_height + duration_height,
+        )
+
+        self._row_height = content_height + 2 * item_ipady
+        self._row_pitch = self._row_height + ROW_GAP
+        self._row_pitch_px = self._row_pitch * scaling
+        self._layout_row(probe_row)
+        self._row_pool.append(probe_row)
+
+    def _layout_row(self, item_frame):
+        """
+        Gives a row frame the fixed row height and places its labels at the
+        measured offsets. Rows use place rather than grid: the layout is fixed,
+        so there is nothing for grid's solver to work out per row.
+        """
+        item_frame.configure(height=self._row_height)
+        thumb_y, name_y, duration_y, size_date_y = self._row_layout
+        text_x = THUMBNAIL_SIZE[0] + 15
+        item_frame._thumb_label.place(x=5, y=thumb_y)
+        item_frame._name_label.place(x=text_x, y=name_y)
+        item_frame._duration_label.place(x=text_x, y=duration_y)
+        item_frame._size_date_label.place(x=text_x, y=size_date_y)
+
+    @staticmethod
+    def _compute_name_wraplength(window_width):
+        return max(100, window_width - THUMBNAIL_SIZE[0] - 80)
+
+    def _fit_name(self, name):
+        """Returns name cut to fit NAME_MAX_LINES lines at the current wraplength."""
+        fitted = self._fitted_names.get(name)
+        if fitted is None:
+            fitted = self._fitted_names[name] = _fit_text_lines(
+                name, self.app.ui_font.measure, self._name_wraplength, NAME_MAX_LINES
             )
+        return fitted
 
-        self.history_item_frames.insert(index, item_frame)
-        setattr(item_frame, "_original_fg_color", item_default_bg)
-        setattr(item_frame, "_history_item_index", index)
+    def _on_app_resize(self, event):
+        """
+        Re-wraps the item names of all built rows once the window width changed
+        enough, and refits the names in view to the new width.
+        """
+        if event.widget is not self.app:
+            return  # The toplevel's binding also sees every child's <Configure>
+        wraplength = self._compute_name_wraplength(event.width)
+        if abs(wraplength - self._name_wraplength) <= NAME_REWRAP_THRESHOLD:
+            return
+        self._name_wraplength = wraplength
+        self._fitted_names.clear()
+        for item_frame in [*self._visible_rows.values(), *self._row_pool]:
+            item_frame._name_label.configure(wraplength=wraplength)
+        self._render_visible_rows(refill=True)
+
+    def _on_viewport_change(self, event=None):
+        """Coalesces scroll/resize notifications into one render per idle pass."""
+        if not self._render_pending:
+            self._render_pending = True
+            self.app.after_idle(self._render_visible_rows)
+
+    def _render_visible_rows(self, refill=False):
+        """
+        Places a row for every history index in (or near) the viewport and
+        returns rows that scrolled out to the pool. With refill, rows that stay
+        visible are filled again too (the history itself changed).
+        """
+        self._render_pending = False
+        items = self.app.history_items_with_paths
+        canvas = self._canvas
+        if self._row_pitch is None or not items or not canvas.winfo_exists():
+            return
 
-        item_frame.grid_columnconfigure(
-            0, weight=0, minsize=THUMBNAIL_SIZE[0] + 10
+        top = canvas.canvasy(0) - self._rows_container.winfo_y()
+        first = max(0, int(top // self._row_pitch_px) - ROW_OVERSCAN)
+        last = min(
+            len(items),
+            int((top + canvas.winfo_height()) // self._row_pitch_px) + 1 + ROW_OVERSCAN,
         )
-        item_frame.grid_columnconfigure(1, weight=1)
-
-        # Thumbnail (placeholder first)
-        item_type = item_data.get("item_type", "video")
-        placeholder_img = (
-            self.app.placeholder_audio_ctk_image
-            if item_type == "audio"
-            else self.app.placeholder_video_ctk_image
+
+        # Locals for the per-row loops below (run on every scroll step)
+        visible_rows = self._visible_rows
+        row_pool = self._row_pool
+        row_pitch = self._row_pitch
+        fill_row = self._fill_row
+
+        for index in [i for i in visible_rows if not first <= i < last]:
+            self._release_row(visible_rows.pop(index))
+
+        for index in range(first, last):
+            frame = visible_rows.get(index)
+            if frame is None:
+                frame = row_pool.pop() if row_pool else self._build_row()
+                visible_rows[index] = frame
+                frame.place(x=0, y=index * row_pitch + 1, relwidth=1)
+            elif not refill:
+                continue
+            fill_row(frame, index)
+
+    def _release_row(self, item_frame):
+        """Takes a row out of the list and returns it to the pool."""
+        item_frame.place_forget()
+        self._unmap_row(item_frame)
+        setattr(item_frame, "_item_id", None)
+        self._row_pool.append(item_frame)
+
+    def _unmap_row(self, item_frame):
+        """Forgets which item a row showed (unless another row shows it now)."""
+        if self._rows_by_item_id.get(item_frame._item_id) is item_frame:
+            del self._rows_by_item_id[item_frame._item_id]
+
+    def _build_row(self):
+        """Creates one history row frame with empty labels; _fill_row gives it content."""
+        item_frame = ctk.CTkFrame(
+            self._rows_container,
+            corner_radius=3,
+            fg_color=self._item_default_bg,
+        )
+        setattr(item_frame, "_history_item_index", None)
+        setattr(item_frame, "_item_id", None)
+        setattr(item_frame, "_is_highlighted", False)
+        setattr(item_frame, "_shows_missing_file", False)
+
+        thumb_label = ctk.CTkLabel(
+            item_frame,
+            text="",
+            image=self.app.placeholder_video_ctk_image or self._get_blank_image(),
         )
-        thumb_label = ctk.CTkLabel(item_frame, text="", image=placeholder_img)
-        thumb_label.grid(row=0, column=0, rowspan=3, padx=5, pady=3, sticky="w")
         setattr(item_frame, "_thumb_label", thumb_label)
 
-        # Text Labels
-        name_text = item_data.get("display_name_base", "Unknown Item")
-        calculated_wraplength = self.app.winfo_width() - THUMBNAIL_SIZE[0] - 80
-        if calculated_wraplength < 100:
-            calculated_wraplength = 100
         name_label = ctk.CTkLabel(
             item_frame,
-            text=name_text,
+            text="",
             font=self.app.ui_font,
             anchor="w",
-            wraplength=calculated_wraplength,
+            justify="left",
+            wraplength=self._name_wraplength,
         )
-        name_label.grid(row=0, column=1, padx=5, pady=(3, 0), sticky="new")
+        setattr(item_frame, "_name_label", name_label)
 
-        duration_text = item_data.get(
-            "formatted_duration", "Duration: Calculating..."
-        )
         duration_label = ctk.CTkLabel(
             item_frame,
-            text=duration_text,
+            text="",
             font=self.app.ui_font_small,
             anchor="w",
             text_color="gray",
         )
-        duration_label.grid(row=1, column=1, padx=5, pady=(0, 0), sticky="new")
         setattr(item_frame, "_duration_label", duration_label)
 
-        size_date_text = f"Size: {item_data.get('formatted_size', '-')}   Date: {item_data.get('download_date_str', 'N/A')}"
         size_date_label = ctk.CTkLabel(
             item_frame,
-            text=size_date_text,
+            text="",
             font=self.app.ui_font_small,
             anchor="w",
             text_color="gray",
         )
-        size_date_label.grid(row=2, column=1, padx=5, pady=(0, 3), sticky="new")
+        setattr(item_frame, "_size_date_label", size_date_label)
 
-        # Bind events
+        # The first row is built before the layout is measured (from it)
+        if self._row_layout is not None:
+            self._layout_row(item_frame)
+
+        # The same three bound methods serve every row; they find the row (and
+        # its current index, as rows are reused) from the event's widget
         widgets_to_bind = [
             item_frame,
             thumb_label,
@@ -164,44 +479,106 @@ class HistoryManager:
             size_date_label,
         ]
         for widget in widgets_to_bind:
-            widget.bind(
-                "<Button-1>",
-                lambda event, idx=index, frm=item_frame: self.on_history_single_click(
-                    event, idx, frm
-                ),
-            )
-            widget.bind(
-                "<Double-Button-1>",
-                lambda event, idx=index: self.on_history_double_click(event, idx),
-            )
-            widget.bind(
-                "<Button-3>",
-                lambda event, idx=index: self.show_history_context_menu(
-                    event, idx
-                ),
-            )
+            setattr(widget, "_row_frame", item_frame)
+            widget.bind("<Button-1>", self._on_row_single_click)
+            widget.bind("<Double-Button-1>", self._on_row_double_click)
+            widget.bind("<Button-3>", self._on_row_context_menu)
             widget.configure(cursor="hand2")
 
         return item_frame
 
+    @staticmethod
+    def _row_for_event(event):
+        """
+        Returns the row frame an event happened in. CTk widgets bind on their
+        inner canvas/label, so the CTk widget is the event widget's master.
+        """
+        return getattr(event.widget.master, "_row_frame", None)
+
+    def _on_row_single_click(self, event):
+        item_frame = self._row_for_event(event)
+        if item_frame is not None and item_frame._history_item_index is not None:
+            self.on_history_single_click(
+                event, item_frame._history_item_index, item_frame
+            )
+
+    def _on_row_double_click(self, event):
+        item_frame = self._row_for_event(event)
+        if item_frame is not None and item_frame._history_item_index is not None:
+            self.on_history_double_click(event, item_frame._history_item_index)
+
+    def _on_row_context_menu(self, event):
+        item_frame = self._row_for_event(event)
+        if item_frame is not None and item_frame._history_item_index is not None:
+            self.show_history_context_menu(event, item_frame._history_item_index)
+
+    def _fill_row(self, item_frame, index):
+        """Shows history item `index` in a (pooled) row frame."""
+        item_data = self.app.history_items_with_paths[index]
+        setattr(item_frame, "_history_item_index", index)
+        self._unmap_row(item_frame)
+        setattr(item_frame, "_item_id", item_data["_id"])
+        self._rows_by_item_id[item_data["_id"]] = item_frame
+
+        self._set_row_highlight(item_frame, index == self.highlighted_item_index)
+
+        thumb_image = self.app.thumbnail_cache.get(
+            (item_data.get("thumbnail_path"), item_data.get("thumbnail_mtime_ns"))
+        )
+        if thumb_image is None:
+            thumb_image = (
+                self.app.placeholder_audio_ctk_image
+                if item_data.get("item_type", "video") == "audio"
+                else self.app.placeholder_video_ctk_image
+            ) or self._get_blank_image()
+        item_frame._thumb_label.configure(image=thumb_image)
+        item_frame._name_label.configure(
+            text=self._fit_name(item_data.get("display_name_base", "Unknown Item"))
+        )
+        # Items whose file turned out to be gone get a subdued name
+        file_missing = not item_data.get("file_exists", True)
+        if item_frame._shows_missing_file != file_missing:
+            item_frame._name_label.configure(
+                text_color="gray" if file_missing else self._name_text_color
+            )
+            item_frame._shows_missing_file = file_missing
+        item_frame._duration_label.configure(
+            text=item_data.get("formatted_duration", "Duration: Calculating...")
+        )
+        item_frame._size_date_label.configure(text=item_data["size_date_text"])
+
+    def _get_blank_image(self):
+        """
+        Shared gray stand-in for when the placeholder images couldn't be made.
+        A row always needs some image: CTkLabel ignores image=None, so a
+        reused row would keep showing its previous item's thumbnail.
+        """
+        if self._blank_ctk_image is None:
+            blank_img_pil = Image.new("RGB", THUMBNAIL_SIZE, color=(200, 200, 200))
+            self._blank_ctk_image = ctk.CTkImage(
+                light_image=blank_img_pil,
+                dark_image=blank_img_pil,
+                size=THUMBNAIL_SIZE,
+            )
+        return self._blank_ctk_image
+
     def _queue_missing_thumbnails_for_load(self):
-        """Scans all history items and queues background loading for missing thumbnails."""
+        """Queues background loading for history thumbnails that aren't cached yet."""
         thumbnail_loading_jobs = []
-        for index, item_data in enumerate(self.app.history_items_with_paths):
+        for item_data in self.app.history_items_with_paths:
             thumb_path = item_data.get("thumbnail_path")
+            thumb_mtime_ns = item_data.get("thumbnail_mtime_ns")
             if (
                 thumb_path
-                and os.path.exists(thumb_path)
-                and thumb_path not in self.app.thumbnail_cache
+                and thumb_mtime_ns is not None
+                and (thumb_path, thumb_mtime_ns) not in self.app.thumbnail_cache
             ):
                 thumbnail_loading_jobs.append(
-                    {"thumb_path": thumb_path, "original_index": index}
-                )
-            elif thumb_path and thumb_path in self.app.thumbnail_cache:
-                # If already in cache, apply it now
-                self.update_history_item_ui(
-                    index,
-                    {"ctk_image": self.app.thumbnail_cache[thumb_path]},
+                    {
+                        "thumb_path": thumb_path,
+                        "thumb_mtime_ns": thumb_mtime_ns,
+                        "item_id": item_data["_id"],
+                    }
                 )
 
         if thumbnail_loading_jobs:
@@ -209,62 +586,65 @@ class HistoryManager:
                 thumbnail_loading_jobs
             )
 
-    def update_history_item_ui(self, item_index, update_data):
-        """Updates a single existing history item's UI without redrawing the whole list."""
-        if not (0 <= item_index < len(self.history_item_frames)):
-            return
+    def update_item_duration(self, item_id, duration):
+        """Stores a probed duration on its item and shows it, if the item's row is rendered."""
+        item = self._items_by_id.get(item_id)
+        if item is None:
+            return  # Removed from the history while its probe ran
+        item["duration"] = duration
+        item["formatted_duration"] = self.app.app_logic._format_duration(duration)
+        self.update_history_item_ui(
+            item_id, {"formatted_duration": item["formatted_duration"]}
+        )
 
-        item_frame = self.history_item_frames[item_index]
-        if not item_frame.winfo_exists():
+    def update_history_item_ui(self, item_id, update_data):
+        """Updates a single history row in place, if that item's row is currently rendered."""
+        item_frame = self._rows_by_item_id.get(item_id)
+        if item_frame is None or not item_frame.winfo_exists():
             return
 
         if "formatted_duration" in update_data:
-            duration_label = getattr(item_frame, "_duration_label", None)
-            if duration_label and duration_label.winfo_exists():
-                duration_label.configure(
-                    text=update_data["formatted_duration"]
-                )
+            item_frame._duration_label.configure(
+                text=update_data["formatted_duration"]
+            )
 
         if "ctk_image" in update_data:
-            thumb_label = getattr(item_frame, "_thumb_label", None)
-            if thumb_label and thumb_label.winfo_exists():
-                thumb_label.configure(image=update_data["ctk_image"])
+            item_frame._thumb_label.configure(image=update_data["ctk_image"])
 
     def on_history_single_click(self, event, item_index, clicked_item_frame):
         if not (0 <= item_index < len(self.app.history_items_with_paths)):
             return
 
-        if self.currently_highlighted_item_frame == clicked_item_frame:
+        if self.highlighted_item_index == item_index:
             return
 
-        if self.currently_highlighted_item_frame:
-            original_color = getattr(
-                self.currently_highlighted_item_frame,
-                "_original_fg_color",
-                get_ctk_color_from_theme_path("CTkFrame.fg_color"),
-            )
-            self.currently_highlighted_item_frame.configure(
-                fg_color=original_color
-            )
+        previous_frame = self._visible_rows.get(self.highlighted_item_index)
+        if previous_frame is not None and previous_frame.winfo_exists():
+            self._set_row_highlight(previous_frame, False)
+
+        self._set_row_highlight(clicked_item_frame, True)
+        self.highlighted_item_index = item_index
 
-        highlight_bg = get_ctk_color_from_theme_path("CTkButton.hover_color")
-        clicked_item_frame.configure(fg_color=highlight_bg)
-        self.currently_highlighted_item_frame = clicked_item_frame
+    def _set_row_highlight(self, item_frame, highlighted):
+        """Recolors a row only when its highlight state actually changes."""
+        if item_frame._is_highlighted != highlighted:
+            item_frame.configure(
+                fg_color=self._highlight_bg if highlighted else self._item_default_bg
+            )
+            item_frame._is_highlighted = highlighted
 
     def on_history_double_click(self, event, item_index):
         if not (0 <= item_index < len(self.app.history_items_with_paths)):
             return
 
-        if self.history_item_frames and 0 <= item_index < len(
-            self.history_item_frames
-        ):
-            clicked_frame = self.history_item_frames[item_index]
+        clicked_frame = self._visible_rows.get(item_index)
+        if clicked_frame is not None:
             self.on_history_single_click(event, item_index, clicked_frame)
 
         item_data = self.app.history_items_with_paths[item_index]
         file_path = item_data.get("file_path")
-        if file_path and os.path.exists(file_path):
-            self.app.app_logic.open_file_with_player(file_path)
+        if file_path and item_data.get("file_exists", True):
+            self._open_item_with_player(item_index, item_data)
         elif file_path:
             self.app.messagebox.showwarning(
                 "Open Error", f"File not found:\n{file_path}", parent=self.app
@@ -274,56 +654,79 @@ class HistoryManager:
                 "Open Error", "No valid file path for this item.", parent=self.app
             )
 
+    def _open_item_with_player(self, item_index, item):
+        """
+        Opens a history item's file. Existence is taken from the item (set when
+        it was added) and only re-checked when opening fails; a file found
+        missing then is flagged so its row is shown subdued.
+        """
+        file_path = item["file_path"]
+        if self.app.app_logic.open_file_with_player(file_path):
+            return
+        if not os.path.exists(file_path):
+            item["file_exists"] = False
+            item_frame = self._visible_rows.get(item_index)
+            if item_frame is not None:
+                self._fill_row(item_frame, item_index)
+
     def show_history_context_menu(self, event, item_index):
         if not (0 <= item_index < len(self.app.history_items_with_paths)):
             return
 
-        if self.history_item_frames and 0 <= item_index < len(
-            self.history_item_frames
-        ):
-            clicked_frame = self.history_item_frames[item_index]
+        clicked_frame = self._visible_rows.get(item_index)
+        if clicked_frame is not None:
             self.on_history_single_click(event, item_index, clicked_frame)
 
-        self.app.history_context_menu.delete(0, ctk.END)
+        self._build_context_menu()
+        self._ctx_index = item_index
+        try:
+            self.app.history_context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self.app.history_context_menu.grab_release()
+
+    def _build_context_menu(self):
+        """
+        Fills the history context menu once (again only after a font change).
+        Its commands act on self._ctx_index, set by each right-click.
+        """
         if not self.app.context_menu_tk_font:
             self.app.ui_manager._create_font_objects()
+        font = self.app.context_menu_tk_font
+        if self._context_menu_built and self._context_menu_font is font:
+            return
 
-        self.app.history_context_menu.add_command(
+        menu = self.app.history_context_menu
+        menu.delete(0, ctk.END)
+        menu.add_command(
             label="Open with Player",
-            command=lambda idx=item_index: self._context_open_with_player(idx),
-            font=self.app.context_menu_tk_font,
+            command=lambda: self._context_open_with_player(self._ctx_index),
+            font=font,
         )
-        self.app.history_context_menu.add_command(
+        menu.add_command(
             label="Open File Location",
-            command=lambda idx=item_index: self._context_open_file_location(
-                idx
-            ),
-            font=self.app.context_menu_tk_font,
+            command=lambda: self._context_open_file_location(self._ctx_index),
+            font=font,
         )
-        self.app.history_context_menu.add_separator()
-        self.app.history_context_menu.add_command(
+        menu.add_separator()
+        menu.add_command(
             label="Copy File Path",
-            command=lambda idx=item_index: self._context_copy_file_path(idx),
-            font=self.app.context_menu_tk_font,
+            command=lambda: self._context_copy_file_path(self._ctx_index),
+            font=font,
         )
-        self.app.history_context_menu.add_command(
+        menu.add_command(
             label="Remove from History",
-            command=lambda idx=item_index: self._context_remove_from_history(
-                idx
-            ),
-            font=self.app.context_menu_tk_font,
+            command=lambda: self._context_remove_from_history(self._ctx_index),
+            font=font,
         )
-        try:
-            self.app.history_context_menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            self.app.history_context_menu.grab_release()
+        self._context_menu_built = True
+        self._context_menu_font = font
 
     def _context_open_with_player(self, item_index):
         if 0 <= item_index < len(self.app.history_items_with_paths):
             item = self.app.history_items_with_paths[item_index]
             file_path = item.get("file_path")
-            if file_path and os.path.exists(file_path):
-                self.app.app_logic.open_file_with_player(file_path)
+            if file_path and item.get("file_exists", True):
+                self._open_item_with_player(item_index, item)
             elif file_path:
                 self.app.messagebox.showwarning(
                     "Open Error",
@@ -341,7 +744,7 @@ class HistoryManager:
         if 0 <= item_index < len(self.app.history_items_with_paths):
             item = self.app.history_items_with_paths[item_index]
             file_path = item.get("file_path")
-            if file_path and os.path.exists(file_path):
+            if file_path and item.get("file_exists", True):
                 folder_path = os.path.dirname(file_path)
                 try:
                     if sys.platform.startswith("win"):
@@ -372,6 +775,8 @@ class HistoryManager:
             item = self.app.history_items_with_paths[item_index]
             file_path = item.get("file_path")
             if file_path:
+                import pyperclip  # Deferred: only the context-menu copy uses it
+
                 try:
                     pyperclip.copy(file_path)
                     self.app.log_message(f"Copied to clipboard: {file_path}")
@@ -393,24 +798,18 @@ class HistoryManager:
                 f"Remove '{display_name}' from history?\n(This will not delete the file from your disk.)",
                 parent=self.app,
             ):
-                # Unhighlight if it's the one being removed
-                if (
-                    self.currently_highlighted_item_frame
-                    == self.history_item_frames[item_index]
-                ):
-                    self.currently_highlighted_item_frame = None
-
-                # Remove from data list
-                del self.app.history_items_with_paths[item_index]
+                # Unhighlight if it's the one being removed; later items move up
+                if self.highlighted_item_index is not None:
+                    if self.highlighted_item_index == item_index:
+                        self.highlighted_item_index = None
+                    elif self.highlighted_item_index > item_index:
+                        self.highlighted_item_index -= 1
 
-                # Remove from UI list
-                frame_to_remove = self.history_item_frames.pop(item_index)
-                if frame_to_remove.winfo_exists():
-                    frame_to_remove.destroy()
+                del self.app.history_items_with_paths[item_index]
+                self._items_by_id.pop(item_data["_id"], None)
 
-                # Re-assign indices to all subsequent frames
-                for i in range(item_index, len(self.history_item_frames)):
-                    setattr(self.history_item_frames[i], "_history_item_index", i)
+                # Rows keep their positions; the visible ones just show new items
+                self._schedule_redraw()
 
                 self.app.log_message(f"Removed '{display_name}' from history.")
 
@@ -422,26 +821,45 @@ class HistoryManager:
         thumbnail_path=None,
         sub_indicator="",
         download_date_str=None,
+        download_timestamp=None,
     ):
         file_size_bytes = 0
-        if file_path and os.path.exists(file_path):
+        file_exists = False
+        if file_path:
             try:
-                file_size_bytes = os.path.getsize(file_path)
+                file_size_bytes = os.stat(file_path).st_size
+                file_exists = True
+            except FileNotFoundError:
+                pass
             except OSError as e:
+                file_exists = True
                 self.app.log_message(
                     f"Could not get size for downloaded file {file_path}: {e}"
                 )
 
         formatted_size = self._format_filesize(file_size_bytes)
+        # The list is ordered by the numeric timestamp; the date string is display only
+        if download_timestamp is None:
+            download_timestamp = datetime.datetime.now().timestamp()
+        if download_date_str is None:
+            download_date_str = datetime.datetime.fromtimestamp(
+                download_timestamp
+            ).strftime("%Y-%m-%d %H:%M")
+        thumbnail_mtime_ns = self._get_mtime_ns(thumbnail_path) if thumbnail_path else None
 
         new_item = {
+            "_id": next(self._item_ids),
             "display_name_base": display_name_base,
             "file_path": file_path,
+            "file_exists": file_exists,
             "item_type": item_type,
             "thumbnail_path": thumbnail_path,
+            "thumbnail_mtime_ns": thumbnail_mtime_ns,
             "file_size_bytes": file_size_bytes,
             "formatted_size": formatted_size,
             "download_date_str": download_date_str,
+            "download_timestamp": download_timestamp,
+            "size_date_text": f"Size: {formatted_size}   Date: {download_date_str}",
             "sub_indicator": sub_indicator,
             "duration": None,
             "formatted_duration": "Duration: Calculating..."
@@ -449,112 +867,201 @@ class HistoryManager:
             else "Duration: N/A",
         }
 
-        # Insert new item at the top of the data list (since it's newest)
-        self.app.history_items_with_paths.insert(0, new_item)
+        # The list is kept newest first, so the new item (usually the newest)
+        # goes in by binary search instead of re-sorting the whole history
+        insert_index = self._history_insert_index(download_timestamp)
+        self.app.history_items_with_paths.insert(insert_index, new_item)
+        self._items_by_id[new_item["_id"]] = new_item
 
-        # Insert the new UI element at the top of the listbox
-        self._create_and_insert_history_item_ui(new_item, 0)
+        if (
+            self.highlighted_item_index is not None
+            and self.highlighted_item_index >= insert_index
+        ):
+            self.highlighted_item_index += 1
 
-        # Re-assign indices for all frames
-        for i, frame in enumerate(self.history_item_frames):
-            setattr(frame, "_history_item_index", i)
+        # Items from insert_index on moved down one row; refill the rows in view
+        # (and queue the new item's thumbnail) along with other new items
+        self._schedule_redraw(thumbnails=thumbnail_mtime_ns is not None)
 
-        # Queue thumbnail and duration calculation for the new item (at index 0)
-        if thumbnail_path and os.path.exists(thumbnail_path):
-            self._queue_missing_thumbnails_for_load()
+        # Queue duration calculation for the new item
 
-        if file_path and os.path.exists(file_path) and (item_type in ["video", "audio"]):
+        if file_exists and (item_type in ["video", "audio"]):
             self.app.log_message(
                 f"INFO: Queued duration calculation for new item: {os.path.basename(file_path)}"
             )
             self.app.app_logic.start_duration_calculation_for_files(
-                [{"file_path": file_path, "original_index": 0}]
+                [{"file_path": file_path, "item_id": new_item["_id"]}]
             )
 
+    def _history_insert_index(self, download_timestamp):
+        """
+        Returns where an item downloaded at download_timestamp (epoch seconds)
+        belongs in the newest-first history (before any items with the same
+        timestamp), by binary search.
+        """
+        items = self.app.history_items_with_paths
+        low, high = 0, len(items)
+        while low < high:
+            mid = (low + high) // 2
+            if items[mid]["download_timestamp"] > download_timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
     def load_existing_downloads_to_history(self):
-        """Scans the download directory and populates the history list."""
+        """
+        Scans the download directory on a worker thread; the resulting history
+        is installed on the UI thread by _install_scanned_history.
+        """
         self.app.log_message(
             f"Scanning '{self.app.download_dir}' for existing media files..."
         )
-        current_history_items = []
-        files_needing_duration = []
-
+        self._scan_generation += 1
+        threading.Thread(
+            target=self._scan_downloads_worker,
+            args=(self.app.download_dir, self._scan_generation),
+            daemon=True,
+            name="history_scan",
+        ).start()
+
+    def _scan_downloads_worker(self, download_dir, scan_generation):
+        """
+        Builds the history items for download_dir and posts them to the UI
+        queue. Runs off the Tk thread, so it only touches os.* and local data.
+        """
         try:
-            if not os.path.isdir(self.app.download_dir):
-                self.app.log_message(
-                    f"Download directory '{self.app.download_dir}' not found. Skipping scan."
+            if not os.path.isdir(download_dir):
+                self.app.ui_queue.put(
+                    f"Download directory '{download_dir}' not found. Skipping scan."
                 )
-                if self.app.history_items_with_paths:
-                    self.app.history_items_with_paths.clear()
-                    self.redraw_history_listbox()
+                self.app.ui_queue.put((MSG_HISTORY_SCAN_DONE, scan_generation, None))
                 return
 
-            for filename in os.listdir(self.app.download_dir):
-                full_path = os.path.join(self.app.download_dir, filename)
-                if not os.path.isfile(full_path):
+            current_history_items = []
+            stat_errors = []  # (filename, error); reported in one log line below
+            # One directory listing: DirEntry caches its stat, and thumbnails are
+            # found by name in it instead of with an exists() call per file
+            with os.scandir(download_dir) as dir_entries:
+                entries_by_name = {entry.name: entry for entry in dir_entries}
+
+            # Locals for the per-file loop
+            splitext = os.path.splitext
+            media_type_for = MEDIA_TYPE_BY_EXTENSION.get
+            entry_named = entries_by_name.get
+            fromtimestamp = datetime.datetime.fromtimestamp
+            format_filesize = self._format_filesize
+            add_item = current_history_items.append
+            item_ids = self._item_ids
+
+            for filename, entry in entries_by_name.items():
+                base_name, extension = splitext(filename)
+                media_type = media_type_for(extension.lower())
+                if media_type is None or not entry.is_file():
                     continue
+                item_type, display_prefix = media_type
 
-                item_type, display_prefix = (None, "")
-                if filename.lower().endswith(VIDEO_EXTENSIONS):
-                    item_type, display_prefix = "video", "[Video]"
-                elif filename.lower().endswith(AUDIO_EXTENSIONS):
-                    item_type, display_prefix = "audio", "[Audio]"
-                else:
+                full_path = entry.path
+                try:
+                    stat_result = entry.stat()
+                except OSError as e:
+                    stat_errors.append((filename, str(e)))
                     continue
 
-                base, _ = os.path.splitext(full_path)
-                expected_thumb_path = base + ".jpg"
-                thumbnail_path_to_use = (
-                    expected_thumb_path if os.path.exists(expected_thumb_path) else None
+                thumb_entry = entry_named(base_name + ".jpg")
+                thumbnail_path_to_use = thumbnail_mtime_ns = None
+                if thumb_entry is not None:
+                    try:
+                        thumbnail_mtime_ns = thumb_entry.stat().st_mtime_ns
+                        thumbnail_path_to_use = thumb_entry.path
+                    except OSError as e:
+                        stat_errors.append((thumb_entry.name, str(e)))
+
+                file_size_bytes = stat_result.st_size
+                download_timestamp = stat_result.st_mtime
+                download_date_str = fromtimestamp(download_timestamp).strftime(
+                    "%Y-%m-%d %H:%M"
                 )
 
-                file_size_bytes = os.path.getsize(full_path)
-                mtime = os.path.getmtime(full_path)
-                download_date_str = datetime.datetime.fromtimestamp(
-                    mtime
-                ).strftime("%Y-%m-%d %H:%M")
-
+                formatted_size = format_filesize(file_size_bytes)
                 new_item = {
+                    "_id": next(item_ids),
                     "display_name_base": f"{display_prefix} {filename}",
                     "file_path": full_path,
+                    "file_exists": True,
                     "item_type": item_type,
                     "thumbnail_path": thumbnail_path_to_use,
+                    "thumbnail_mtime_ns": thumbnail_mtime_ns,
                     "file_size_bytes": file_size_bytes,
-                    "formatted_size": self._format_filesize(file_size_bytes),
+                    "formatted_size": formatted_size,
                     "download_date_str": download_date_str,
+                    "download_timestamp": download_timestamp,
+                    "size_date_text": f"Size: {formatted_size}   Date: {download_date_str}",
                     "sub_indicator": "",
                     "duration": None,
                     "formatted_duration": "Duration: Calculating...",
                 }
-                current_history_items.append(new_item)
+                add_item(new_item)
+
+            if stat_errors:
+                self.app.ui_queue.put(
+                    f"WARN: Scan could not stat {len(stat_errors)} file(s); "
+                    f"first: {stat_errors[0][0]} ({stat_errors[0][1]})"
+                )
 
             # Sort by date (newest first)
             current_history_items.sort(
-                key=lambda x: x.get("download_date_str") or "0", reverse=True
+                key=lambda x: x["download_timestamp"], reverse=True
             )
+        except Exception as e:
+            self.app.ui_queue.put(
+                f"ERROR: Error scanning directory for existing files: {e}"
+            )
+            return
 
-            # Assign to app state and redraw UI
-            self.app.history_items_with_paths = current_history_items
-            self.redraw_history_listbox()  # Full redraw is appropriate for initial load
+        self.app.ui_queue.put(
+            (MSG_HISTORY_SCAN_DONE, scan_generation, current_history_items)
+        )
 
-            # Queue duration calculations for all found items
-            for i, item in enumerate(current_history_items):
-                files_needing_duration.append(
-                    {"file_path": item["file_path"], "original_index": i}
-                )
+    def _install_scanned_history(self, scan_generation, current_history_items):
+        """Shows a finished folder scan and queues duration probes for its files."""
+        if scan_generation != self._scan_generation:
+            return  # A newer scan was started meanwhile; its result will follow
+
+        if current_history_items is None:
+            if self.app.history_items_with_paths:
+                self.app.history_items_with_paths.clear()
+                self._items_by_id.clear()
+                self.highlighted_item_index = None
+                self.redraw_history_listbox()
+            return
 
-            if files_needing_duration:
-                self.app.log_message(
-                    f"INFO: Queued duration calculation for {len(files_needing_duration)} existing file(s)."
-                )
-                self.app.app_logic.start_duration_calculation_for_files(
-                    files_needing_duration
-                )
+        # Assign to app state and redraw UI
+        self.app.history_items_with_paths = current_history_items
+        self._items_by_id = {item["_id"]: item for item in current_history_items}
+        self.highlighted_item_index = None
+        self.redraw_history_listbox()  # Full redraw is appropriate for initial load
 
-        except Exception as e:
+        # Queue duration calculations for all found items
+        files_needing_duration = [
+            {"file_path": item["file_path"], "item_id": item["_id"]}
+            for item in current_history_items
+        ]
+        if files_needing_duration:
             self.app.log_message(
-                f"ERROR: Error scanning directory for existing files: {e}"
+                f"INFO: Queued duration calculation for {len(files_needing_duration)} existing file(s)."
             )
+            self.app.app_logic.start_duration_calculation_for_files(
+                files_needing_duration
+            )
+
+    @staticmethod
+    def _get_mtime_ns(path):
+        """Returns path's modification time in ns, or None if it can't be stat'ed."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
 
     def _format_filesize(self, size_bytes):
         if size_bytes is None:
@@ -565,24 +1072,24 @@ class HistoryManager:
                 return "0 B"
             if size_bytes < 0:
                 return "- (invalid size)"
-            units = ["B", "KiB", "MiB", "GiB", "TiB"]
-            i = 0
-            while size_bytes >= 1024 and i < len(units) - 1:
-                size_bytes /= 1024
-                i += 1
-            return f"{size_bytes:.1f} {units[i]}"
-        except (ValueError, TypeError):
+            # Each unit is 2**10 of the previous one, so the bit length gives the unit
+            i = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(FILESIZE_UNITS) - 1)
+            return f"{size_bytes / (1 << (i * 10)):.1f} {FILESIZE_UNITS[i]}"
+        except (ValueError, TypeError, OverflowError):
             return "-"
 
     def clear_download_history_data(self):
         self.app.history_items_with_paths.clear()
-        self._clear_history_display()
-        self.redraw_history_listbox()
+        self._items_by_id.clear()
+        self.highlighted_item_index = None
+        # Pools the rows and shows the "No history items" label; no rebuild needed
+        self._refresh_history_rows()
         self.app.log_message("Download history list cleared.")
 
     def clear_thumbnail_cache_data(self):
         self.app.log_message("Starting to clear thumbnail cache...")
         self.app.thumbnail_cache.clear()
+        self.app.app_logic.clear_thumbnail_image_cache()
         self.app.log_message(
             "In-memory Python thumbnail cache (CTkImage objects) cleared."
         )
@@ -590,21 +1097,34 @@ class HistoryManager:
         deleted_files_count = 0
         failed_deletions_count = 0
 
-        # Clear from history items and delete associated files
+        # Collect the thumbnails and their resized cache copies, then delete
+        # them on a few threads so the removals' disk latency overlaps
+        thumb_paths = {}  # dict as an ordered set: items may share a thumbnail
+        resized_cache_paths = {}
         for item in self.app.history_items_with_paths:
             thumb_path = item.get("thumbnail_path")
-            if (
-                thumb_path
-                and os.path.exists(thumb_path)
-                and thumb_path.lower().endswith(".jpg")
-            ):
-                try:
-                    os.remove(thumb_path)
-                    deleted_files_count += 1
-                except OSError as e:
-                    self.app.log_message(f"Failed to delete {thumb_path}: {e}")
-                    failed_deletions_count += 1
+            if thumb_path:
+                if thumb_path.lower().endswith(".jpg"):
+                    thumb_paths[thumb_path] = None
+                resized_cache_paths[thumb_path + THUMBNAIL_CACHE_SUFFIX] = None
+
+        with ThreadPoolExecutor(max_workers=THUMBNAIL_DELETE_WORKERS) as executor:
+            thumb_results = list(executor.map(_remove_file, thumb_paths))
+            resized_results = list(executor.map(_remove_file, resized_cache_paths))
+
+        for path, removed, error in thumb_results:
+            if removed:
+                deleted_files_count += 1
+            elif error is not None:
+                self.app.log_message(f"Failed to delete {path}: {error}")
+                failed_deletions_count += 1
+        for path, _, error in resized_results:
+            if error is not None:
+                self.app.log_message(f"Failed to delete {path}: {error}")
+
+        for item in self.app.history_items_with_paths:
             item["thumbnail_path"] = None
+            item["thumbnail_mtime_ns"] = None
 
         # Redraw to show placeholders instead of old thumbnails
         self.redraw_history_listbox()
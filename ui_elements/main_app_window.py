@@ -32,8 +32,8 @@ from ui_elements.format_selection_window import FormatSelectionWindow
 from ui_elements.tooltip import Tooltip
 
 # Import the new modularized components
-from ui_elements.app_logic import AppLogic, MSG_DURATION_DONE
-from ui_elements.history_manager import HistoryManager
+from ui_elements.app_logic import AppLogic, MSG_DURATION_DONE, MSG_DOWNLOAD_WORKER_DONE
+from ui_elements.history_manager import HistoryManager, MSG_HISTORY_SCAN_DONE
 from ui_elements.ui_manager import UIManager
 from ui_elements.format_fetcher import FormatFetcher
 
@@ -108,6 +108,10 @@ class VideoDownloaderApp(ctk.CTk):
     def __init__(self):
         super().__init__()
         self._is_closing = False
+        # Dialog module used by the helper components (self.app.messagebox.*);
+        # they run on the Tk thread, so dialogs are shown directly rather than
+        # through after() callbacks.
+        self.messagebox = messagebox
 
         self.settings = sm_load_settings()
         ctk.set_appearance_mode(self.settings.get("appearance_mode", "System"))
@@ -129,16 +133,29 @@ class VideoDownloaderApp(ctk.CTk):
                     f"ERROR: Creating download directory failed: {e}. Using {self.download_dir}"
                 )
 
-        self.download_queue = queue.Queue()
-        self.thumbnail_gen_queue = queue.Queue()
-        self.duration_queue = queue.Queue()
-        self.format_info_queue = queue.Queue()
+        # All worker threads (downloads, history thumbnails/durations, format
+        # fetches) report to the UI through this one queue; message types are
+        # distinct, so process_all_queues dispatches on them with one drain.
+        self.ui_queue = queue.Queue()
+        self._ui_message_handlers = {
+            MSG_DOWNLOAD_ITEM_ADDED: self._on_download_item_added,
+            MSG_DOWNLOAD_ITEM_UPDATE: self._update_active_download_item_ui,
+            MSG_DOWNLOAD_ITEM_STATUS: self._handle_download_item_final_status,
+            MSG_THUMB_LOADED_FOR_HISTORY: self._on_history_thumbnail_loaded,
+            MSG_DURATION_DONE: self._on_duration_done,
+            MSG_DOWNLOAD_WORKER_DONE: self._on_download_worker_done,
+            MSG_HISTORY_SCAN_DONE: self._on_history_scan_done,
+            "FORMAT_DICT_DATA": self._on_format_dict_data,
+            "FORMAT_ERROR": self._on_format_error,
+            MSG_LOG_PREFIX: lambda text: self.log_message(str(text)),
+        }
 
         self.download_threads = []
         self.history_items_with_paths = []
         self.thumbnail_cache = {}
 
         self.pending_downloads = queue.Queue()
+        self._running_download_ids = set()  # Started, final status not yet received
         self.active_downloads = {}
         self.current_active_download_id = None
         self.current_download_cancel_event = None
@@ -495,8 +512,9 @@ class VideoDownloaderApp(ctk.CTk):
             )
             self.format_selection_window_instance.focus()
         else:
-            self.format_selection_window_instance.lift()
-            self.format_selection_window_instance.focus()
+            # Reuse the existing (usually hidden) window instead of rebuilding it
+            self.format_selection_window_instance.repopulate(formats_data)
+            self.format_selection_window_instance.show()
 
     def on_url_type_toggle(self, value):
         if not self.winfo_exists():
@@ -588,15 +606,23 @@ class VideoDownloaderApp(ctk.CTk):
         if not self.winfo_exists() or self._is_closing:
             return
 
-        if not self.current_active_download_id and not self.pending_downloads.empty():
+        # Keep up to max_parallel_downloads running; the download pool has
+        # as many workers, so none of these waits for a free one.
+        max_parallel = self.app_logic.max_parallel_downloads
+        while (
+            len(self._running_download_ids) < max_parallel
+            and not self.pending_downloads.empty()
+        ):
             download_data = self.pending_downloads.get()
             self.log_message(
                 f"Starting next queued download: {download_data.get('url')[:50]}..."
             )
-            self.app_logic.run_download_process_threaded_actual(
-                **download_data
+            self._running_download_ids.add(
+                self.app_logic.run_download_process_threaded_actual(
+                    **download_data
+                )
             )
-        elif self.current_active_download_id is None:
+        if not self._running_download_ids:
             self._reset_ui_on_download_completion(is_full_reset=True)
 
     def on_cancel_download_click(self):
@@ -741,125 +767,101 @@ class VideoDownloaderApp(ctk.CTk):
             return
 
         self._main_queue_processor_after_id = None
-        self._process_download_queue()
-        self._process_thumbnail_queue()
-        self._process_duration_queue()
-        self._process_format_queue()
+        self.drain_ui_queue()
 
         if self.winfo_exists() and not self._is_closing:
             self._schedule_main_queue_processor()
 
-    def _process_download_queue(self):
-        try:
-            while True:
-                if not self.winfo_exists() or self._is_closing:
-                    break
-                msg_type, *payload = self.download_queue.get_nowait()
-
-                if msg_type == MSG_DOWNLOAD_ITEM_ADDED:
-                    download_id, item_data = payload
-                    self._create_active_download_item_ui(download_id, item_data)
-                    self.current_active_download_id = download_id
-                elif msg_type == MSG_DOWNLOAD_ITEM_UPDATE:
-                    self._update_active_download_item_ui(*payload)
-                elif msg_type == MSG_DOWNLOAD_ITEM_STATUS:
-                    self._handle_download_item_final_status(*payload)
-                elif msg_type == MSG_LOG_PREFIX:
-                    self.log_message(str(payload[0]))
-        except queue.Empty:
-            pass
-        except Exception as e:
-            if not self._is_closing:
-                self.log_message(f"ERROR in download_queue processing: {e}")
-
-    def _process_thumbnail_queue(self):
-        try:
-            while True:
-                if not self.winfo_exists() or self._is_closing:
-                    break
-                msg_type, *payload = self.thumbnail_gen_queue.get_nowait()
-
-                if msg_type == MSG_THUMB_LOADED_FOR_HISTORY:
-                    thumb_path, ctk_image, index = payload
-                    self.thumbnail_cache[thumb_path] = ctk_image
-                    if self.history_manager:
-                        self.history_manager.update_history_item_ui(
-                            index, {"ctk_image": ctk_image}
-                        )
-                elif msg_type == MSG_LOG_PREFIX:
-                    self.log_message(str(payload[0]))
-        except queue.Empty:
-            pass
-        except Exception as e:
-            if not self._is_closing:
-                self.log_message(f"ERROR in thumbnail_queue processing: {e}")
-
-    def _process_duration_queue(self):
-        try:
-            while True:
-                if not self.winfo_exists() or self._is_closing:
-                    break
-                msg_type, *payload = self.duration_queue.get_nowait()
-
-                if msg_type == MSG_DURATION_DONE:
-                    file_path, duration, index = payload
-                    item_to_update = self.history_items_with_paths[index]
-                    item_to_update["duration"] = duration
-                    formatted_duration = self.app_logic._format_duration(
-                        duration
-                    )
-                    item_to_update["formatted_duration"] = formatted_duration
-                    if self.history_manager:
-                        self.history_manager.update_history_item_ui(
-                            index, {"formatted_duration": formatted_duration}
-                        )
-                elif msg_type == MSG_LOG_PREFIX:
-                    self.log_message(str(payload[0]))
-        except queue.Empty:
-            pass
-        except Exception as e:
-            if not self._is_closing:
-                self.log_message(f"ERROR in duration_queue processing: {e}")
-
-    def _process_format_queue(self):
-        try:
-            while True:
-                if not self.winfo_exists() or self._is_closing:
-                    break
-                msg_type, data = self.format_info_queue.get_nowait()
-
-                if self.get_formats_button.winfo_exists():
-                    self.get_formats_button.configure(
-                        state="normal", text="🎞️ Get Formats"
-                    )
+    def drain_ui_queue(self):
+        """Drains the shared worker-to-UI queue, dispatching on each message's type."""
+        while self.winfo_exists() and not self._is_closing:
+            try:
+                message = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if isinstance(message, str):
+                    # Plain log line from a worker, already prefixed with MSG_LOG_PREFIX
+                    if message.startswith(MSG_LOG_PREFIX):
+                        message = message[len(MSG_LOG_PREFIX):].lstrip()
+                    self.log_message(message)
+                    continue
+                msg_type, *payload = message
+                handler = self._ui_message_handlers.get(msg_type)
+                if handler is not None:
+                    handler(*payload)
+            except Exception as e:
+                if not self._is_closing:
+                    self.log_message(f"ERROR in UI queue processing: {e}")
+
+    def _on_download_item_added(self, download_id, item_data):
+        self._create_active_download_item_ui(download_id, item_data)
+        self.current_active_download_id = download_id
+
+    def _on_history_thumbnail_loaded(self, thumb_key, ctk_image, item_id):
+        # Keyed on (path, mtime_ns): a rewritten thumbnail file is loaded afresh
+        self.thumbnail_cache[thumb_key] = ctk_image
+        if self.history_manager:
+            self.history_manager.update_history_item_ui(
+                item_id, {"ctk_image": ctk_image}
+            )
 
-                if msg_type == "FORMAT_JSON_DATA":
-                    parsed = self.format_fetcher._parse_formats_json(data)
-                    if parsed:
-                        self.open_format_selection_window(parsed)
-                    else:
-                        self.messagebox.showinfo(
-                            "No Formats",
-                            "Could not parse any formats.",
-                            parent=self,
-                        )
-                elif msg_type == "FORMAT_ERROR":
-                    self.messagebox.showerror(
-                        "Format Fetch Error", str(data), parent=self
-                    )
-                elif msg_type == MSG_LOG_PREFIX:
-                    self.log_message(f"(FormatFetch) {data}")
-        except queue.Empty:
-            pass
-        except Exception as e:
-            if not self._is_closing:
-                self.log_message(f"ERROR in format_info_queue processing: {e}")
+    def _on_history_scan_done(self, scan_generation, history_items):
+        if self.history_manager:
+            self.history_manager._install_scanned_history(
+                scan_generation, history_items
+            )
+
+    def _on_download_worker_done(self, download_id, error):
+        if not self.winfo_exists() or self._is_closing:
+            return
+        if error is not None:
+            self.log_message(
+                f"ERROR: Download worker failed: {type(error).__name__}: {error}"
+            )
+        if download_id not in self._running_download_ids:
+            return  # Its final status arrived first and already freed the slot
+        # The worker ended without a final status (it raised, or the status
+        # couldn't be queued): free its slot so queued downloads keep moving
+        if error is None:
+            self.log_message("WARN: A download ended without reporting a final status.")
+        self._running_download_ids.discard(download_id)
+        self._remove_active_download_item_ui(download_id)
+        self.start_next_download_if_available()
+
+    def _on_duration_done(self, file_path, duration, item_id):
+        if self.history_manager:
+            self.history_manager.update_item_duration(item_id, duration)
+
+    def _reset_get_formats_button(self):
+        if self.get_formats_button.winfo_exists():
+            self.get_formats_button.configure(state="normal", text="🎞️ Get Formats")
+
+    def _on_format_dict_data(self, url, info):
+        self._show_parsed_formats(url, self.format_fetcher._parse_formats_dict(info))
+
+    def _show_parsed_formats(self, url, parsed):
+        self._reset_get_formats_button()
+        if parsed:
+            self.format_fetcher.cache_formats(url, parsed)
+            self.open_format_selection_window(parsed)
+        else:
+            self.messagebox.showinfo(
+                "No Formats",
+                "Could not parse any formats.",
+                parent=self,
+            )
+
+    def _on_format_error(self, data):
+        self._reset_get_formats_button()
+        self.messagebox.showerror("Format Fetch Error", str(data), parent=self)
 
     def _handle_download_item_final_status(self, download_id, status_payload):
         if not self.winfo_exists() or self._is_closing:
             return
 
         self._update_active_download_item_ui(download_id, status_payload)
+        self._running_download_ids.discard(download_id)
         is_playlist_item = status_payload.get("is_playlist_item", False)
 
         if status_payload["status"] in ["completed", "failed"]:
@@ -871,6 +873,7 @@ class VideoDownloaderApp(ctk.CTk):
                     thumbnail_path=status_payload.get("thumbnail_path"),
                     sub_indicator=status_payload.get("sub_indicator", ""),
                     download_date_str=status_payload.get("download_date_str"),
+                    download_timestamp=status_payload.get("download_timestamp"),
                 )
 
         if is_playlist_item:
@@ -924,8 +927,8 @@ class VideoDownloaderApp(ctk.CTk):
             self.app_logic.global_hotkey_manager.stop_listener()
 
         active_threads = [
-            t for t in self.download_threads if t.is_alive()
-        ] + [t for t in self.app_logic.thumbnail_gen_threads if t.is_alive()]
+            f for f in self.download_threads if not f.done()
+        ] + self.app_logic.active_background_workers()
 
         if active_threads:
             if messagebox.askyesno(
@@ -934,6 +937,7 @@ class VideoDownloaderApp(ctk.CTk):
                 parent=self,
             ):
                 print("DEBUG: User confirmed exit despite active processes.")
+                self.app_logic.shutdown_workers()
                 self.destroy()
             else:
                 print("DEBUG: User cancelled exit.")
@@ -941,4 +945,5 @@ class VideoDownloaderApp(ctk.CTk):
                 self._schedule_main_queue_processor()
         else:
             print("DEBUG: No active processes found. Destroying application.")
+            self.app_logic.shutdown_workers()
             self.destroy()
\ No newline at end of file
@@ -283,6 +283,7 @@ class SettingsWindow(ctk.CTkToplevel):
         if player_cmd != self.app.settings.get("player_command", DEFAULT_PLAYER_COMMAND): # Only save if changed
             self.app.settings["player_command"] = player_cmd
             self.app.save_app_settings()
+            self.app.app_logic.refresh_player_command()
             self.app.log_message(f"Preferred player command set to: '{player_cmd if player_cmd else 'OS Default'}'")
 
     def save_subtitle_settings(self, _=None):
@@ -16,17 +16,7 @@ from constants import (
     MSG_DOWNLOAD_ITEM_UPDATE,
     MSG_DOWNLOAD_ITEM_STATUS,
 )
-
-# Helper function to get startupinfo (Windows-specific)
-def get_subprocess_startupinfo():
-    """Returns platform-specific startupinfo to prevent console window."""
-    if sys.platform.startswith("win"):
-        si = subprocess.STARTUPINFO()
-        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-        si.wShowWindow = subprocess.SW_HIDE
-        return si
-    return None
-
+from utils import POPEN_PLATFORM_KWARGS
 
 # Error patterns for yt-dlp output
 YT_DLP_ERROR_PATTERNS = [
@@ -128,9 +118,13 @@ def _parse_yt_dlp_error_internal(output_lines):
 
 
 # Constants for internal use
-CREATE_NO_WINDOW = 0x08000000
 QUEUE_PUT_TIMEOUT = 0.05
 MAX_OUTPUT_LINES_FOR_ERROR_PARSE = 1000
+LOG_STREAM_PREFIXES = {
+    "stdout": f"{MSG_LOG_PREFIX} [stdout] ",
+    "stderr": f"{MSG_LOG_PREFIX} [stderr] ",
+}
+LOG_THUMBNAIL_GEN_PREFIX = f"{MSG_LOG_PREFIX} (thumbnail-gen) "
 
 
 class SubprocessOutputProcessor(threading.Thread):
@@ -177,6 +171,7 @@ class SubprocessOutputProcessor(threading.Thread):
 
     def _read_stream(self, stream, stream_name):
         """Reads lines from a stream (stdout/stderr) and processes them."""
+        log_prefix = LOG_STREAM_PREFIXES[stream_name]
         for line in iter(stream.readline, ""):
             if not line:
                 break
@@ -281,12 +276,9 @@ class SubprocessOutputProcessor(threading.Thread):
                                 match.group(1).strip()
                             )
 
-            # Log the line to the main app's log view
+            # Log the line to the main app's log view (best effort, never blocks)
             try:
-                self.output_queue.put(
-                    f"{MSG_LOG_PREFIX} [{stream_name}] {line_strip}",
-                    timeout=QUEUE_PUT_TIMEOUT,
-                )
+                self.output_queue.put_nowait(log_prefix + line_strip)
             except queue.Full:
                 pass
         stream.close()
@@ -300,13 +292,8 @@ class SubprocessOutputProcessor(threading.Thread):
                 text=True,
                 encoding="utf-8",
                 errors="replace",
-                creationflags=CREATE_NO_WINDOW
-                if sys.platform.startswith("win")
-                else 0,
-                startupinfo=get_subprocess_startupinfo()
-                if sys.platform.startswith("win")
-                else None,
                 env=self.subprocess_env_path,
+                **POPEN_PLATFORM_KWARGS,
             )
             print(
                 f"DEBUG: SubprocessOutputProcessor launched yt-dlp process {self.process.pid}."
@@ -396,10 +383,7 @@ class SubprocessOutputProcessor(threading.Thread):
 
             def log_adapter(msg):
                 try:
-                    self.output_queue.put(
-                        f"{MSG_LOG_PREFIX} (thumbnail-gen) {msg}",
-                        timeout=QUEUE_PUT_TIMEOUT,
-                    )
+                    self.output_queue.put_nowait(LOG_THUMBNAIL_GEN_PREFIX + msg)
                 except queue.Full:
                     pass
 
@@ -441,12 +425,14 @@ class SubprocessOutputProcessor(threading.Thread):
         sub_indicator="",
     ):
         """Helper to construct and send the final status message to the queue."""
+        finished_at = datetime.datetime.now()
         status_payload = {
             "status": status,
             "message": message,
             "file_path": file_path,
             "download_success": status == "completed",
-            "download_date_str": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "download_date_str": finished_at.strftime("%Y-%m-%d %H:%M"),
+            "download_timestamp": finished_at.timestamp(),
             "item_type_for_history": self.download_type.lower(),
             "is_playlist_item": self.is_playlist_item,
             "title": self.download_title,
@@ -1,10 +1,43 @@
+import sys
+import subprocess
+from functools import lru_cache
 import customtkinter as ctk
 
+
+def get_subprocess_startupinfo():
+    """Returns platform-specific startupinfo to prevent console window."""
+    if sys.platform.startswith("win"):
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        si.wShowWindow = subprocess.SW_HIDE
+        return si
+    return None
+
+
+# Popen/run arguments that keep helper processes (yt-dlp, ffmpeg, ffprobe) from
+# opening a console window on Windows; empty elsewhere. Built once and shared:
+# Popen copies the startupinfo per call.
+POPEN_PLATFORM_KWARGS = (
+    {
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+        "startupinfo": get_subprocess_startupinfo(),
+    }
+    if sys.platform.startswith("win")
+    else {}
+)
+
 def get_ctk_color_from_theme_path(path_string):
     """
     Helper function to get a color from the CustomTkinter theme dictionary.
     This function handles the nested dictionary structure and (light_color, dark_color) tuples.
     """
+    return _resolve_theme_color(path_string, ctk.get_appearance_mode() == "Dark")
+
+
+# The color theme is loaded once at startup, so a lookup only depends on the
+# path and the appearance mode (which the user can toggle at runtime).
+@lru_cache(maxsize=32)
+def _resolve_theme_color(path_string, is_dark):
     parts = path_string.split(".")
     current_dict = ctk.ThemeManager.theme
     
@@ -18,13 +51,45 @@ def get_ctk_color_from_theme_path(path_string):
     final_color_value = current_dict
 
     # If it's a tuple (light_color, dark_color), return based on current appearance mode
-    if ctk.get_appearance_mode() == "Dark":
-        mode_index = 1
-    else:
-        mode_index = 0
+    mode_index = 1 if is_dark else 0
 
     if isinstance(final_color_value, (list, tuple)) and len(final_color_value) == 2:
         return final_color_value[mode_index]
     else:
         # Otherwise, return the value as is (it should already be a color string)
-        return final_color_value
\ No newline at end of file
+        return final_color_value
+
+
+def _resolve_clipboard_sequence_reader():
+    """Returns a no-argument callable giving the OS clipboard change counter, or None."""
+    try:
+        if sys.platform.startswith("win"):
+            import ctypes
+            return ctypes.windll.user32.GetClipboardSequenceNumber
+        if sys.platform.startswith("darwin"):
+            from AppKit import NSPasteboard
+            return NSPasteboard.generalPasteboard().changeCount
+    except Exception:
+        pass
+    return None
+
+
+# Resolved once: on platforms without a counter every poll then returns None
+# straight away instead of retrying (and failing) the import/lookup.
+_clipboard_sequence_reader = _resolve_clipboard_sequence_reader()
+
+
+def get_clipboard_sequence_number():
+    """
+    Returns a counter that changes whenever the system clipboard changes, or None
+    if the platform has no cheap way to query it (e.g. Linux, or macOS without PyObjC).
+    Lets callers skip reading the clipboard contents when nothing new was copied.
+    """
+    global _clipboard_sequence_reader
+    if _clipboard_sequence_reader is None:
+        return None
+    try:
+        return _clipboard_sequence_reader()
+    except Exception:
+        _clipboard_sequence_reader = None  # Broken here; stop trying
+        return None